@@ -1,38 +1,82 @@
 from flask import Flask
-from flask_apscheduler import APScheduler
-from flask_jwt_extended import JWTManager
 
-from app.routes import v1_bp
 from app.database import get_db
-from app.services import CSVService
+from app.services import (MetricsService, CaptureService, CachingJWTManager,
+                          RateLimitService, LoadSheddingService, WriteQueueService,
+                          ArchiveService, ExportService)
+from app.commands import users_cli, archive_cli, stats_cli, export_cli
 from .config import Config
 
-scheduler = APScheduler()
-jwt = JWTManager()
+# "api" serves HTTP only, "importer" runs the scheduled jobs (and serves its
+# own import status and metrics), "all" does both in one process.
+ROLES = ("api", "importer", "all")
 
-def create_app(config_object=Config):
+# Created by create_app in roles that run the scheduled jobs
+scheduler = None
+jwt = CachingJWTManager()
+
+def create_app(config_object=Config, role=None):
     """
     Create and configure an instance of the Flask application.
 
+    Only the importer loads CSVService (pandas, numpy) and APScheduler; the
+    database engine is created on first use in every role.
+
+    Args:
+        config_object: Configuration object to load.
+        role (str | None): One of ROLES; defaults to the APP_ROLE setting.
+
     Returns:
         Flask: Configured Flask application instance.
+
+    Raises:
+        ValueError: If the role is unknown.
     """
+    global scheduler
 
     app = Flask(__name__)
     app.config.from_object(config_object)
 
+    role = role or app.config.get("APP_ROLE", "all")
+    if role not in ROLES:
+        raise ValueError(f"Unknown app role {role!r}, expected one of {', '.join(ROLES)}")
+    app.config["APP_ROLE"] = role
+
     from . import database
     database.init_db(app)
 
-    app.register_blueprint(v1_bp, url_prefix="/api/v1")
+    MetricsService.init_app(app)
+
+    from app.routes import v1_blueprint
+    app.register_blueprint(v1_blueprint(role), url_prefix="/api/v1")
+
+    if role in ("api", "all"):
+        CaptureService.init_app(app)
+        RateLimitService.init_app(app)
+        LoadSheddingService.init_app(app)
+
+        jwt.init_app(app)
+
+    WriteQueueService.init_app(app)
+    ArchiveService.init_app(app)
+    ExportService.init_app(app)
 
+    # Scheduled jobs, including draining the write queue, run in one
+    # importer process; API workers only enqueue.
+    if role in ("importer", "all"):
+        from flask_apscheduler import APScheduler
+        from app.services import CSVService
 
-    CSVService.init_app(app)
+        CSVService.init_app(app)
 
-    scheduler.init_app(app)
-    scheduler.start()
+        scheduler = APScheduler()
+        scheduler.init_app(app)
+        scheduler.start()
 
-    jwt.init_app(app)
+    app.cli.add_command(users_cli)
+    app.cli.add_command(archive_cli)
+    app.cli.add_command(stats_cli)
+    app.cli.add_command(export_cli)
 
 
     return app
\ No newline at end of file
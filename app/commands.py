@@ -0,0 +1,81 @@
+import click
+from flask.cli import AppGroup
+
+from app import database
+from app.services import AuthService, ArchiveService, StatsService, ExportService
+
+users_cli = AppGroup("users", help="Manage API users and service accounts.")
+archive_cli = AppGroup("archive", help="Move stale listings to the archive table.")
+stats_cli = AppGroup("stats", help="Maintain the building statistics rollup.")
+export_cli = AppGroup("export", help="Write columnar snapshots of the building dataset.")
+
+@users_cli.command("create")
+@click.argument("username")
+@click.option("--service", is_flag=True, help="Create a service account with a generated API key.")
+@click.option("--password", help="Password for regular users (prompted when omitted).")
+def create_user(username: str, service: bool, password: str | None):
+    """
+    Create a user. Service accounts log in with their API key as password
+    and receive long-lived tokens.
+    """
+    if not service and not password:
+        password = click.prompt("Password", hide_input=True, confirmation_prompt=True)
+
+    with database.SessionLocal() as db:
+        _, secret = AuthService.create_user(db=db, username=username,
+                                            password=password, is_service=service)
+
+    if service:
+        click.echo(f"Created service account '{username}'. API key (shown once): {secret}")
+    else:
+        click.echo(f"Created user '{username}'.")
+
+
+
+@archive_cli.command("run")
+@click.option("--offer-id", type=int, help="Only listings with this offer.")
+@click.option("--import-batch", help="Only listings loaded by this CSV import.")
+@click.option("--imported-only", is_flag=True, help="Only listings loaded by any CSV import.")
+@click.option("--older-than-days", type=int, help="Only listings not updated for this many days.")
+@click.option("--batch-size", type=int, help="Buildings moved per transaction.")
+def run_archive(offer_id, import_batch, imported_only, older_than_days, batch_size):
+    """
+    Archive listings matching the given criteria, or the configured
+    ARCHIVE_RULES when no criteria are given.
+    """
+    rule = {
+        "offer_id": offer_id,
+        "import_batch": import_batch,
+        "imported_only": imported_only,
+        "older_than_days": older_than_days,
+    }
+    if not any(rule.values()):
+        ArchiveService.run()
+        return
+
+    archived = ArchiveService.archive(rule, batch_size=batch_size)
+    click.echo(f"Archived {archived} buildings.")
+
+
+@stats_cli.command("rebuild")
+def rebuild_stats():
+    """
+    Recompute the statistics rollup from the building table. Only needed
+    after loading data outside of the API and importer (e.g. a SQL restore).
+    """
+    with database.transactional_session() as db:
+        StatsService.rebuild(db)
+    click.echo("Rebuilt building statistics.")
+
+
+@export_cli.command("run")
+@click.option("--format", "formats", multiple=True, type=click.Choice(sorted(ExportService.EXTENSIONS)),
+              help="Output format, may be repeated (default: EXPORT_FORMATS).")
+@click.option("--batch-size", type=int, help="Rows fetched and written per batch.")
+def run_export(formats, batch_size):
+    """
+    Export a snapshot of all buildings now, instead of waiting for `export_job`.
+    """
+    result = ExportService.export(formats=list(formats) or None, batch_size=batch_size)
+    for path in result["files"].values():
+        click.echo(f"Wrote {result['rows']} buildings to {path}")
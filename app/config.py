@@ -23,19 +23,58 @@ class Config:
             'trigger': 'interval',
             'minutes': 1,
         },
+        {
+            'id': 'write_queue_job',
+            'func': 'app.services.write_queue_service:WriteQueueService.process_queue',
+            'trigger': 'interval',
+            'seconds': int(os.getenv('WRITE_QUEUE_INTERVAL', 5)),
+        },
+        {
+            'id': 'archive_job',
+            'func': 'app.services.archive_service:ArchiveService.run',
+            'trigger': 'cron',
+            'hour': int(os.getenv('ARCHIVE_HOUR', 3)),
+        },
+        {
+            'id': 'export_job',
+            'func': 'app.services.export_service:ExportService.run',
+            'trigger': 'cron',
+            'hour': int(os.getenv('EXPORT_HOUR', 2)),
+        },
     ]
 
-    # Database
+    # Process role: "api" serves HTTP, "importer" runs the scheduled jobs, "all" does both
+    APP_ROLE = os.getenv("APP_ROLE", "all")
+
+    # Database (checked and turned into a URI by database.init_db)
     POSTGRES_USER = os.getenv('POSTGRES_USER')
     POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD')
     POSTGRES_DB = os.getenv('POSTGRES_DB')
     POSTGRES_HOST = os.getenv('POSTGRES_HOST')
 
-    if not all([POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_DB, POSTGRES_HOST]):
-        raise RuntimeError("Missing one or more required database environment variables.")
+    SQLALCHEMY_DATABASE_URI = os.getenv("SQLALCHEMY_DATABASE_URI")   # overrides POSTGRES_*
+
+    DB_POOL_SIZE    = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))   # seconds; exceeded -> 503
+
+    # --- Rate limiting (token bucket per client and scope) ---
+    RATELIMIT_ENABLED = os.getenv("RATELIMIT_ENABLED", "true").lower() == "true"
+    RATELIMIT_BACKEND = os.getenv("RATELIMIT_BACKEND",
+                                  "app.services.rate_limit_service:InMemoryRateLimitBackend")
+    RATELIMIT_RULES = {
+        # requests per second, bucket capacity
+        "search": {"rate": float(os.getenv("RATELIMIT_SEARCH_RATE", 10)),
+                   "burst": int(os.getenv("RATELIMIT_SEARCH_BURST", 20))},
+        "read":   {"rate": float(os.getenv("RATELIMIT_READ_RATE", 50)),
+                   "burst": int(os.getenv("RATELIMIT_READ_BURST", 100))},
+    }
 
-    SQLALCHEMY_DATABASE_URI = \
-        f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:5432/{POSTGRES_DB}"
+    # --- Load shedding (reads give way to writes when the pool is busy) ---
+    LOAD_SHED_ENABLED       = os.getenv("LOAD_SHED_ENABLED", "true").lower() == "true"
+    LOAD_SHED_WRITE_RESERVE = int(os.getenv("LOAD_SHED_WRITE_RESERVE", 3))      # connections kept for writes
+    LOAD_SHED_MAX_POOL_WAIT = float(os.getenv("LOAD_SHED_MAX_POOL_WAIT", 0.5))  # seconds
+    LOAD_SHED_RETRY_AFTER   = int(os.getenv("LOAD_SHED_RETRY_AFTER", 1))        # seconds
 
 
     # --- Data directories (all absolute) ---
@@ -45,11 +84,51 @@ class Config:
     PROCESSED_DIR= DATA_DIR / "processed"
     ERRORED_DIR  = DATA_DIR / "errored"
 
+    # --- CSV import profiles, tried in order; the first matching the file name wins ---
+    IMPORT_PROFILES = os.getenv("IMPORT_PROFILES", "app.services.import_profiles:RealtorProfile").split(",")
+
+    # --- CSV import input: plain, gzip, zstd (needs `zstandard`) and zip files ---
+    IMPORT_PATTERNS       = ["*.csv", "*.gz", "*.zst", "*.zip"]
+    IMPORT_CHUNK_ROWS     = int(os.getenv("IMPORT_CHUNK_ROWS", 100_000))
+    IMPORT_MMAP_MIN_BYTES = int(os.getenv("IMPORT_MMAP_MIN_BYTES", 64 * 1024 * 1024))  # plain files read via mmap
+
+    # --- Write-behind queue for asynchronous building writes ---
+    WRITE_QUEUE_ENABLED       = os.getenv("WRITE_QUEUE_ENABLED", "false").lower() == "true"
+    WRITE_QUEUE_PATH          = Path(os.getenv("WRITE_QUEUE_PATH", PROJECT_ROOT / "var" / "write_queue.sqlite3"))
+    WRITE_QUEUE_BATCH_SIZE    = int(os.getenv("WRITE_QUEUE_BATCH_SIZE", 500))
+    WRITE_QUEUE_LEASE_SECONDS = int(os.getenv("WRITE_QUEUE_LEASE_SECONDS", 300))  # running jobs reclaimed after
+
+    # --- Archival of stale listings (see ArchiveService._where for rule keys) ---
+    ARCHIVE_RULES = [
+        # CSV imports land as offer 1 ("Prodaja") and are never curated
+        {
+            "offer_id": 1,
+            "imported_only": True,
+            "older_than_days": int(os.getenv("ARCHIVE_IMPORTED_MAX_AGE_DAYS", 90)),
+        },
+    ]
+    ARCHIVE_BATCH_SIZE  = int(os.getenv("ARCHIVE_BATCH_SIZE", 1000))
+    ARCHIVE_MAX_BATCHES = int(os.getenv("ARCHIVE_MAX_BATCHES", 100))
+
+    # --- Columnar snapshots of the building dataset (Parquet / Arrow IPC) ---
+    EXPORT_DIR        = Path(os.getenv("EXPORT_DIR", PROJECT_ROOT / "var" / "exports"))
+    EXPORT_FORMATS    = os.getenv("EXPORT_FORMATS", "parquet,arrow").split(",")
+    EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 50_000))   # rows per fetch / row group
+    EXPORT_KEEP       = int(os.getenv("EXPORT_KEEP", 7))               # snapshots kept per format
+
     # --- Conversion rates ---
     NEURO_PER_USD = float(os.getenv("NEURO_PER_USD", 0.90))
     SQM_PER_ACRE  = float(os.getenv("SQM_PER_ACRE", 4047.0))
     SQM_PER_SQFT  = float(os.getenv("SQM_PER_SQFT", 0.092903))
 
+    # --- Request capture (JSONL, replayed by benchmarks.load) ---
+    CAPTURE_ENABLED      = os.getenv("CAPTURE_ENABLED", "false").lower() == "true"
+    CAPTURE_SAMPLE_RATE  = float(os.getenv("CAPTURE_SAMPLE_RATE", 0.01))
+    # Each process writes <stem>.<pid><suffix>, e.g. requests.1234.jsonl
+    CAPTURE_PATH         = Path(os.getenv("CAPTURE_PATH", PROJECT_ROOT / "requests.jsonl"))
+    CAPTURE_MAX_BYTES    = int(os.getenv("CAPTURE_MAX_BYTES", 50 * 1024 * 1024))
+    CAPTURE_BACKUP_COUNT = int(os.getenv("CAPTURE_BACKUP_COUNT", 5))
+
     # --- JSON Web Token (JWT) configuration ---
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "dev-jwt-secret-key")
     JWT_ALGORITHM = "HS512"
@@ -57,3 +136,8 @@ class Config:
     JWT_HEADER_NAME = "Authorization"
     JWT_HEADER_TYPE = "Bearer"
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
+    JWT_SERVICE_TOKEN_EXPIRES = timedelta(days=int(os.getenv("JWT_SERVICE_TOKEN_DAYS", 30)))
+
+    # Verified-token cache: skips HS512 re-verification of known tokens
+    JWT_VERIFY_CACHE_SIZE = int(os.getenv("JWT_VERIFY_CACHE_SIZE", 10_000))
+    JWT_VERIFY_CACHE_TTL  = int(os.getenv("JWT_VERIFY_CACHE_TTL", 3600))  # for tokens without `exp`
@@ -1,3 +1,4 @@
+import threading
 from contextlib import contextmanager
 from sqlalchemy import create_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
@@ -7,35 +8,89 @@ from flask import g
 engine = None
 SessionLocal = None
 
+# Engine arguments recorded by init_db; the engine is created on first use
+_engine_settings = None
+_engine_lock = threading.Lock()
+
 class Base(DeclarativeBase):
     pass
 
 
+class LazySessionmaker(sessionmaker):
+    """
+    sessionmaker that creates the engine when the first session is opened,
+    so processes that never touch the database never connect or load the
+    driver.
+    """
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
+
+def database_uri(config) -> str:
+    """
+    Build the database URI from SQLALCHEMY_DATABASE_URI, or from the
+    POSTGRES_* settings when it is not set.
+
+    Args:
+        config (Mapping): Flask config (or any mapping with the same keys).
+
+    Raises:
+        RuntimeError: If neither is fully configured.
+    """
+    if config.get("SQLALCHEMY_DATABASE_URI"):
+        return config["SQLALCHEMY_DATABASE_URI"]
+
+    user, password, db, host = (config.get(key) for key in
+                                ("POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_HOST"))
+    if not all([user, password, db, host]):
+        raise RuntimeError("Missing one or more required database environment variables.")
+    return f"postgresql://{user}:{password}@{host}:5432/{db}"
+
+
 def init_db(app):
     """
-    Initialize SQLAlchemy engine and session factory using Flask app config.
+    Record engine settings from the Flask app config and create the
+    session factory. The engine itself is created on first use.
     Registers teardown function to close session after each request.
     """
-    global engine, SessionLocal
-
-    database_uri = app.config["SQLALCHEMY_DATABASE_URI"]
-    pool_size = int(app.config.get("DB_POOL_SIZE", 5))
-    max_overflow = int(app.config.get("DB_MAX_OVERFLOW", 10))
-    echo = app.config.get("ENV") == "development"
+    global engine, SessionLocal, _engine_settings
 
-    engine = create_engine(
-        database_uri,
-        pool_size=pool_size,
-        max_overflow=max_overflow,
-        pool_pre_ping=True,
-        echo=echo,
-    )
+    _engine_settings = {
+        "url": database_uri(app.config),
+        "pool_size": int(app.config.get("DB_POOL_SIZE", 5)),
+        "max_overflow": int(app.config.get("DB_MAX_OVERFLOW", 10)),
+        "pool_timeout": float(app.config.get("DB_POOL_TIMEOUT", 30)),
+        "pool_pre_ping": True,
+        "echo": app.config.get("ENV") == "development",
+    }
+    engine = None
 
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    SessionLocal = LazySessionmaker(autocommit=False, autoflush=False)
 
     app.teardown_appcontext(close_db)
 
 
+def get_engine():
+    """
+    Return the engine, creating it on first call.
+
+    Raises:
+        RuntimeError: If init_db has not been called.
+    """
+    global engine
+    if engine is None:
+        with _engine_lock:
+            if engine is None:
+                if _engine_settings is None:
+                    raise RuntimeError("init_db() must be called before using the database.")
+                settings = dict(_engine_settings)
+                engine = create_engine(settings.pop("url"), **settings)
+    return engine
+
+
 def get_db():
     """
     Provide a transactional "scoped" session tied to the Flask 'g' context.
@@ -1,3 +1,7 @@
-from .building import Building, BuildingFloor
+from .building import Building, BuildingFloor, BUILDING_CHANGE_SEQ
 from .location import State, City, CityPart
-from .taxonomy import BuildingAmenity, BuildingHeating, Amenity, Heating, EstateType, Offer
\ No newline at end of file
+from .taxonomy import BuildingAmenity, BuildingHeating, Amenity, Heating, EstateType, Offer
+from .user import User
+from .archive import ArchivedBuilding
+from .stats import BuildingStats
+from .imports import ImportProgress
\ No newline at end of file
@@ -0,0 +1,55 @@
+from datetime import datetime
+from app.database import Base
+from sqlalchemy import (Float, Integer, BigInteger, Boolean, DateTime, ForeignKey, Index, String,
+                        ARRAY, func)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+class ArchivedBuilding(Base):
+    """
+    Building moved out of the hot `building` table by `ArchiveService`.
+    Floor and amenity/heating associations are denormalized into the row.
+
+    `change_seq`/`change_xid` are those of the archiving transaction, so the
+    move shows up in the change feed as a delete of the building.
+    """
+    __tablename__ = "building_archive"
+    __table_args__ = (
+        Index("building_archive_change_idx", "change_xid", "change_seq", unique=True),
+    )
+
+    id:                Mapped[int]   = mapped_column(Integer, primary_key=True)
+    square_footage:    Mapped[float] = mapped_column(Float)
+    construction_year: Mapped[int]   = mapped_column(Integer)
+    land_area:         Mapped[float] = mapped_column(Float)
+    registration:      Mapped[bool]  = mapped_column(Boolean)
+    rooms:             Mapped[float] = mapped_column(Float)
+    bathrooms:         Mapped[int]   = mapped_column(Integer)
+    parking:           Mapped[bool]  = mapped_column(Boolean)
+    price:             Mapped[int]   = mapped_column(Integer)
+
+    estate_type_id: Mapped[int] = mapped_column(Integer,
+        ForeignKey("estate_type.id", ondelete="RESTRICT")
+    )
+    offer_id:       Mapped[int] = mapped_column(Integer,
+        ForeignKey("offer.id", ondelete="RESTRICT")
+    )
+    city_part_id:   Mapped[int] = mapped_column(Integer,
+        ForeignKey("city_part.id", ondelete="RESTRICT")
+    )
+    import_batch:   Mapped[str]  = mapped_column(String)
+
+    change_seq:  Mapped[int]      = mapped_column(BigInteger, nullable=False)
+    change_xid:  Mapped[int]      = mapped_column(BigInteger, nullable=False)
+    updated_at:  Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True),
+        server_default=func.now(), nullable=False
+    )
+
+    floor_level: Mapped[str]       = mapped_column(String)
+    floor_total: Mapped[int]       = mapped_column(Integer)
+    amenity_ids: Mapped[list[int]] = mapped_column(ARRAY(Integer), nullable=False, default=list)
+    heating_ids: Mapped[list[int]] = mapped_column(ARRAY(Integer), nullable=False, default=list)
+
+    estate_type: Mapped["EstateType"] = relationship(viewonly=True)
+    offer:       Mapped["Offer"]       = relationship(viewonly=True)
+    city_part:   Mapped["CityPart"]    = relationship(viewonly=True)
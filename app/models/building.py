@@ -1,9 +1,23 @@
+from datetime import datetime
 from app.database import Base
-from sqlalchemy import Float, Integer, Boolean, ForeignKey, String
+from sqlalchemy import (Float, Integer, BigInteger, Boolean, DateTime, ForeignKey, Index,
+                        Sequence, String, Text, cast, func, text)
 from sqlalchemy.orm import  Mapped, mapped_column, relationship
 
+# Monotonic change sequence, bumped on every insert/update of a building
+BUILDING_CHANGE_SEQ = Sequence("building_change_seq")
+
+# Top-level id of the writing transaction (xid8, as bigint). The change feed
+# orders by (change_xid, change_seq) and only returns rows whose writer has
+# finished, see BuildingService.changes_since.
+CURRENT_XID_SQL = "pg_current_xact_id()::text::bigint"
+CURRENT_XID = cast(cast(func.pg_current_xact_id(), Text), BigInteger)
+
 class Building(Base):
     __tablename__ = "building"
+    __table_args__ = (
+        Index("building_change_idx", "change_xid", "change_seq", unique=True),
+    )
 
     id:                Mapped[int]   = mapped_column(Integer, primary_key=True)
     square_footage:    Mapped[float] = mapped_column(Float)
@@ -25,6 +39,26 @@ class Building(Base):
         ForeignKey("city_part.id", ondelete="RESTRICT")
     )
 
+    # Set by CSVService for imported rows, used to archive whole imports
+    import_batch:   Mapped[str] = mapped_column(String, index=True)
+
+    change_seq: Mapped[int]      = mapped_column(BigInteger, BUILDING_CHANGE_SEQ,
+        server_default=BUILDING_CHANGE_SEQ.next_value(),
+        onupdate=BUILDING_CHANGE_SEQ.next_value(),
+        nullable=False,
+    )
+    change_xid: Mapped[int]      = mapped_column(BigInteger,
+        server_default=text(CURRENT_XID_SQL),
+        onupdate=CURRENT_XID,
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        index=True,
+    )
+
     estate_type: Mapped["EstateType"] = relationship(back_populates="buildings")
     offer:       Mapped["Offer"]       = relationship(back_populates="buildings")
     city_part:   Mapped["CityPart"]    = relationship(back_populates="buildings")
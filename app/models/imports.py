@@ -0,0 +1,24 @@
+from datetime import datetime
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+class ImportProgress(Base):
+    """
+    Source rows of one CSV already committed by `CSVService`, identified by
+    the content hash of the dropped file and the CSV's label (zip members
+    have their own). Written in the transaction of each chunk, so a file
+    that failed part-way resumes after its last committed chunk when it is
+    dropped again, instead of importing those rows twice.
+    """
+    __tablename__ = "import_progress"
+
+    source_sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    label:         Mapped[str] = mapped_column(String, primary_key=True)
+    import_batch:  Mapped[str] = mapped_column(String, nullable=False)
+    rows_done:     Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at:    Mapped[datetime] = mapped_column(DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -0,0 +1,41 @@
+from sqlalchemy import Integer, BigInteger, Float, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+class BuildingStats(Base):
+    """
+    Rollup of active listings per (state, city, estate_type, offer), kept
+    up to date incrementally by `StatsService`. For each metric the row
+    stores the number of non-null values, their sum and sum of squares,
+    from which mean and standard deviation are derived.
+    """
+    __tablename__ = "building_stats"
+    __table_args__ = (
+        UniqueConstraint("state_id", "city_id", "estate_type_id", "offer_id",
+                         name="building_stats_group_key", postgresql_nulls_not_distinct=True),
+    )
+
+    id:             Mapped[int] = mapped_column(Integer, primary_key=True)
+    state_id:       Mapped[int] = mapped_column(Integer)
+    city_id:        Mapped[int] = mapped_column(Integer)
+    estate_type_id: Mapped[int] = mapped_column(Integer)
+    offer_id:       Mapped[int] = mapped_column(Integer)
+
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    price_n:     Mapped[int]   = mapped_column(BigInteger, nullable=False, default=0)
+    price_sum:   Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    price_sumsq: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+
+    square_footage_n:     Mapped[int]   = mapped_column(BigInteger, nullable=False, default=0)
+    square_footage_sum:   Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    square_footage_sumsq: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+
+    land_area_n:     Mapped[int]   = mapped_column(BigInteger, nullable=False, default=0)
+    land_area_sum:   Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    land_area_sumsq: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+
+    # price / square_footage, for rows where both are known
+    price_per_sqm_n:     Mapped[int]   = mapped_column(BigInteger, nullable=False, default=0)
+    price_per_sqm_sum:   Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    price_per_sqm_sumsq: Mapped[float] = mapped_column(Float, nullable=False, default=0)
@@ -0,0 +1,13 @@
+from sqlalchemy import String, Integer, Boolean
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+
+class User(Base):
+    __tablename__ = "app_user"
+
+    id:            Mapped[int]  = mapped_column(Integer, primary_key=True)
+    username:      Mapped[str]  = mapped_column(String, nullable=False, unique=True)
+    password_hash: Mapped[str]  = mapped_column(String, nullable=False)
+    is_service:    Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    is_active:     Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
@@ -1 +1 @@
-from .v1 import v1_bp
\ No newline at end of file
+from .v1 import v1_blueprint
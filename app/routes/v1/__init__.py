@@ -1,10 +1,29 @@
 from flask import Blueprint
 
-# Blueprint for version 1 of the API, grouping all v1 routes
-v1_bp = Blueprint("v1", __name__)
-
 from .building import building_bp
-v1_bp.register_blueprint(building_bp, url_prefix="/buildings")
-
 from .auth import auth_bp
-v1_bp.register_blueprint(auth_bp, url_prefix="/auth")
+from .imports import imports_bp
+from .metrics import metrics_bp
+from .stats import stats_bp
+from .exports import exports_bp
+
+
+def v1_blueprint(role: str) -> Blueprint:
+    """
+    Blueprint for version 1 of the API, grouping the v1 routes served in
+    `role`. Import status is process-local, so it is only served where the
+    import job runs; importer processes serve nothing else but metrics.
+    """
+    v1_bp = Blueprint("v1", __name__)
+
+    if role in ("api", "all"):
+        v1_bp.register_blueprint(building_bp, url_prefix="/buildings")
+        v1_bp.register_blueprint(auth_bp, url_prefix="/auth")
+    if role in ("importer", "all"):
+        v1_bp.register_blueprint(imports_bp, url_prefix="/imports")
+    v1_bp.register_blueprint(metrics_bp, url_prefix="/metrics")
+    if role in ("api", "all"):
+        v1_bp.register_blueprint(stats_bp, url_prefix="/stats")
+        v1_bp.register_blueprint(exports_bp, url_prefix="/exports")
+
+    return v1_bp
@@ -1,4 +1,5 @@
 from flask import Blueprint
+from app.database import get_db
 from app.schemas import LoginRequest
 from flask_pydantic import validate
 from app.services import AuthService
@@ -9,4 +10,5 @@ auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 @auth_bp.route("/login", methods=["POST"])
 @validate(body=LoginRequest)
 def login(body: LoginRequest):
-    return AuthService.login(login_request=body)
+    db = get_db()
+    return AuthService.login(db=db, login_request=body)
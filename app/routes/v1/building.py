@@ -1,16 +1,18 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, abort, jsonify, make_response, stream_with_context, url_for
 from flask_jwt_extended import jwt_required
 
 from app.database import get_db
-from app.schemas import BuildingOut, BuildingSearchQuery, PaginatedBuildings
-from app.schemas.building import BuildingIn
-from app.services import BuildingService
+from app.schemas import BuildingOut, BuildingSearchQuery, PaginatedBuildings, BuildingChangesQuery
+from app.schemas.building import BuildingIn, BuildingPatch
+from app.services import BuildingService, RateLimitService, LoadSheddingService, WriteQueueService
 from flask_pydantic import validate, ValidationError
 
 # Blueprint for building-related routes
 building_bp = Blueprint("buildings", __name__, url_prefix="/buildings")
 
 @building_bp.route("/<int:building_id>", methods=["GET"])
+@RateLimitService.limit("read")
+@LoadSheddingService.shed
 @validate()
 def get_building(building_id) -> BuildingOut:
     """
@@ -24,6 +26,8 @@ def get_building(building_id) -> BuildingOut:
 
     Raises:
         404: If the building with the given ID is not found.
+        429: If the client exceeded its rate limit.
+        503: If the database pool is saturated (reads are shed first).
     """
     db = get_db()
     building_out = BuildingService.get_by_id(db=db, building_id=building_id)
@@ -31,6 +35,8 @@ def get_building(building_id) -> BuildingOut:
 
 
 @building_bp.route("/search", methods=["GET"])
+@RateLimitService.limit("search")
+@LoadSheddingService.shed
 @validate(
     query=BuildingSearchQuery
 )
@@ -48,11 +54,43 @@ def search_buildings(query: BuildingSearchQuery) -> PaginatedBuildings:
 
     Raises:
         422: If query parameters are invalid (e.g. min_sqft > max_sqft).
+        429: If the client exceeded its rate limit.
+        503: If the database pool is saturated (reads are shed first).
     """
 
     db = get_db()
     return BuildingService.search(db=db, filters=query)
 
+@building_bp.route("/changes", methods=["GET"])
+@RateLimitService.limit("read")
+@LoadSheddingService.shed
+@validate(query=BuildingChangesQuery)
+def building_changes(query: BuildingChangesQuery):
+    """
+    Stream building changes after a given cursor, for incremental sync of
+    downstream caches and search indexes.
+
+    Consumers store the `cursor` of the last change they received and pass
+    it as `since` on the next call; an empty response means they are up to
+    date. Changes only appear once their writing transaction (and every
+    older one) has finished, so no change is ever returned behind a cursor
+    already handed out. Archived buildings are reported as deletes.
+
+    Args:
+        query (BuildingChangesQuery): `since` cursor and `limit`.
+
+    Returns:
+        application/x-ndjson: One BuildingChangeOut per line, in cursor order.
+    """
+    db = get_db()
+
+    def generate():
+        for change in BuildingService.changes_since(db=db, since=query.since, limit=query.limit):
+            yield change.model_dump_json() + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
 @building_bp.route("", methods=["POST"])
 @jwt_required()
 @validate(body=BuildingIn)
@@ -100,4 +138,116 @@ def update_building(building_id: int, body: BuildingIn) -> BuildingOut:
     """
     db = get_db()
     updated_building_out = BuildingService.update(db=db, building_id=building_id, building_in=body)
-    return updated_building_out
\ No newline at end of file
+    return updated_building_out
+
+
+@building_bp.route("/<int:building_id>", methods=["PATCH"])
+@jwt_required()
+@validate(body=BuildingPatch)
+def patch_building(building_id: int, body: BuildingPatch) -> BuildingOut:
+    """
+    Partially update an existing building record.
+
+    Only the fields present in the body are written; `amenity_ids` and
+    `heating_ids`, when present, replace the current sets.
+
+    Args:
+        building_id (int): The ID of the building to update.
+        body (BuildingPatch): Pydantic schema containing the fields to change.
+
+    Returns:
+        BuildingOut: The updated building, with nested relations,
+            serialized to JSON by flask-pydantic.
+
+    Raises:
+        404: If the building with `building_id` does not exist, or if any
+            newly added amenity or heating ID does not exist.
+        400: On database integrity errors (e.g., foreign-key violations).
+    """
+    db = get_db()
+    return BuildingService.patch(db=db, building_id=building_id, building_patch=body)
+
+
+def _enqueue(op: str, payload: dict, building_id: int | None = None):
+    """Queue a write and answer 202 with the job id and its status URL."""
+    if not WriteQueueService.ENABLED:
+        payload = {
+            "error": "Asynchronous writes are disabled",
+            "message": "Set WRITE_QUEUE_ENABLED=true or use the synchronous endpoint",
+        }
+        abort(make_response(jsonify(payload), 503))
+
+    job_id = WriteQueueService.enqueue(op=op, payload=payload, building_id=building_id)
+    response = jsonify({
+        "job_id": job_id,
+        "status": "queued",
+        "status_url": url_for("v1.buildings.get_write_job", job_id=job_id),
+    })
+    return response, 202
+
+
+@building_bp.route("/async", methods=["POST"])
+@jwt_required()
+@validate(body=BuildingIn)
+def create_building_async(body: BuildingIn):
+    """
+    Queue the creation of a building.
+
+    Args:
+        body (BuildingIn): Same payload as the synchronous create.
+
+    Returns:
+        202: `job_id` and `status_url` of the queued write.
+
+    Raises:
+        503: If the write-behind queue is disabled.
+    """
+    return _enqueue("create", body.model_dump())
+
+
+@building_bp.route("/<int:building_id>/async", methods=["PATCH"])
+@jwt_required()
+@validate(body=BuildingPatch)
+def patch_building_async(building_id: int, body: BuildingPatch):
+    """
+    Queue a partial update of a building. Queued patches to the same
+    building are merged before being written.
+
+    Args:
+        building_id (int): The ID of the building to update.
+        body (BuildingPatch): Same payload as the synchronous PATCH.
+
+    Returns:
+        202: `job_id` and `status_url` of the queued write.
+
+    Raises:
+        503: If the write-behind queue is disabled.
+    """
+    return _enqueue("patch", body.model_dump(exclude_unset=True), building_id=building_id)
+
+
+@building_bp.route("/jobs/<job_id>", methods=["GET"])
+@jwt_required()
+def get_write_job(job_id: str):
+    """
+    Report the status of a queued write.
+
+    Args:
+        job_id (str): Id returned by an asynchronous write endpoint.
+
+    Returns:
+        JSON with `status` (queued, running, done or error), the affected
+        building id (`result_id`) and the error message, if any.
+
+    Raises:
+        404: If the job id is unknown.
+    """
+    job = WriteQueueService.get(job_id) if WriteQueueService.ENABLED else None
+    if job is None:
+        payload = {
+            "error": "Job not found",
+            "id": job_id,
+            "message": f"Write job {job_id} not found"
+        }
+        abort(make_response(jsonify(payload), 404))
+    return jsonify(job)
\ No newline at end of file
@@ -0,0 +1,82 @@
+from datetime import datetime, timezone
+
+from flask import Blueprint, abort, current_app, jsonify, make_response, send_from_directory
+from flask_jwt_extended import jwt_required
+from flask_pydantic import validate
+
+from app.schemas import ExportFileOut, ExportListOut, ExportTriggerOut
+from app.services import ExportService
+
+# Blueprint for columnar dataset snapshots
+exports_bp = Blueprint("exports", __name__, url_prefix="/exports")
+
+@exports_bp.route("", methods=["GET"])
+@jwt_required()
+@validate()
+def list_exports() -> ExportListOut:
+    """
+    List the available building snapshots.
+
+    Returns:
+        ExportListOut: Snapshot files, newest first.
+    """
+    files = []
+    for path in ExportService.snapshots():
+        stat = path.stat()
+        files.append(ExportFileOut(
+            name=path.name,
+            format=path.suffix.lstrip("."),
+            bytes=stat.st_size,
+            created_at=datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+        ))
+    return ExportListOut(files=files)
+
+
+@exports_bp.route("/<name>", methods=["GET"])
+@jwt_required()
+def download_export(name: str):
+    """
+    Download a snapshot file.
+
+    Args:
+        name (str): File name as returned by the list endpoint.
+
+    Raises:
+        404: If no snapshot with this name exists.
+    """
+    if name not in {path.name for path in ExportService.snapshots()}:
+        payload = {
+            "error": "Export not found",
+            "name": name,
+            "message": f"Export {name} not found"
+        }
+        abort(make_response(jsonify(payload), 404))
+    return send_from_directory(ExportService.DIR, name, as_attachment=True)
+
+
+@exports_bp.route("", methods=["POST"])
+@jwt_required()
+@validate()
+def trigger_export() -> tuple[ExportTriggerOut, int]:
+    """
+    Run `export_job` now in the scheduler instead of at its next cron time.
+
+    Returns:
+        ExportTriggerOut: 202 with the job id; poll the list endpoint for
+            the new files.
+
+    Raises:
+        HTTPException: 409 if this process does not run `export_job`
+            (APP_ROLE=api); use `flask export run` or the importer instead.
+    """
+    scheduler = getattr(current_app, "apscheduler", None)
+    if scheduler is None or scheduler.get_job("export_job") is None:
+        payload = {
+            "error": "Export job not scheduled",
+            "message": f"export_job does not run in the {current_app.config['APP_ROLE']!r} role; "
+                       "trigger the export on the importer or with `flask export run`"
+        }
+        abort(make_response(jsonify(payload), 409))
+
+    job = scheduler.modify_job("export_job", next_run_time=datetime.now(timezone.utc))
+    return ExportTriggerOut(job=job.id, next_run_time=job.next_run_time), 202
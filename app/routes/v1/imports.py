@@ -0,0 +1,21 @@
+from flask import Blueprint, current_app
+from flask_pydantic import validate
+
+from app.schemas import ImportStatusOut
+from app.services import ImportStatusService
+
+# Blueprint for CSV import status routes
+imports_bp = Blueprint("imports", __name__, url_prefix="/imports")
+
+@imports_bp.route("", methods=["GET"])
+@validate()
+def import_status() -> ImportStatusOut:
+    """
+    List running and recent CSV imports with their throughput.
+
+    Returns:
+        ImportStatusOut: Backlog size in DATA_DIR, running imports and
+            recently finished imports (newest first).
+    """
+    return ImportStatusService.status(data_dir=current_app.config["DATA_DIR"],
+                                      patterns=current_app.config["IMPORT_PATTERNS"])
@@ -0,0 +1,16 @@
+from flask import Blueprint, jsonify
+
+from app.services import MetricsService
+
+# Blueprint for the metrics endpoint
+metrics_bp = Blueprint("metrics", __name__, url_prefix="/metrics")
+
+@metrics_bp.route("", methods=["GET"])
+def get_metrics():
+    """
+    Expose API and import pipeline metrics.
+
+    Returns:
+        JSON object with `counters`, `gauges` and `timers` series.
+    """
+    return jsonify(MetricsService.snapshot())
@@ -0,0 +1,35 @@
+from flask import Blueprint
+from flask_pydantic import validate
+
+from app.database import get_db
+from app.schemas import StatsOut, StatsQuery
+from app.services import RateLimitService, LoadSheddingService, StatsService
+
+# Blueprint for precomputed listing statistics
+stats_bp = Blueprint("stats", __name__, url_prefix="/stats")
+
+@stats_bp.route("", methods=["GET"])
+@RateLimitService.limit("read")
+@LoadSheddingService.shed
+@validate(
+    query=StatsQuery
+)
+def get_stats(query: StatsQuery) -> StatsOut:
+    """
+    Count, mean and standard deviation of price, square footage, land area
+    and price per sqm, read from the `building_stats` rollup.
+
+    Args:
+        query (StatsQuery): Name filters and optional `group_by` dimensions.
+
+    Returns:
+        StatsOut: One group per combination of the `group_by` dimensions,
+            or a single overall group.
+
+    Raises:
+        422: If query parameters are invalid (e.g. unknown group_by dimension).
+        429: If the client exceeded its rate limit.
+        503: If the database pool is saturated (reads are shed first).
+    """
+    db = get_db()
+    return StatsService.query(db=db, filters=query)
@@ -1,3 +1,7 @@
 from .building import (BuildingOut, BuildingSearchQuery,
-                       PaginatedBuildings,  BuildingIn)
-from .auth import LoginRequest
\ No newline at end of file
+                       PaginatedBuildings,  BuildingIn, BuildingPatch,
+                       BuildingChangesQuery, BuildingChangeOut)
+from .auth import LoginRequest
+from .imports import ImportRunOut, ImportStatusOut
+from .stats import StatsQuery, MetricStatsOut, StatsGroupOut, StatsOut
+from .exports import ExportFileOut, ExportListOut, ExportTriggerOut
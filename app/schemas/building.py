@@ -1,6 +1,8 @@
 from flask import abort, jsonify
-from pydantic import BaseModel, ConfigDict, Field, model_validator, Extra
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator, Extra
+from pydantic_core import PydanticCustomError
+from typing import Literal, Optional, List
+from datetime import datetime
 from .taxonomy import EstateTypeOut, OfferOut, AmenityOut, HeatingOut
 from .location import CityPartOut
 
@@ -33,18 +35,37 @@ class BuildingIn(BuildingBase):
         extra = Extra.forbid
         validate_all = True
 
+class BuildingPatch(BuildingBase):
+    """
+    Partial update: only the fields present in the payload are written.
+    `amenity_ids`/`heating_ids`, when present, replace the current sets.
+    """
+    estate_type_id: Optional[int] = None
+    offer_id: Optional[int] = None
+    city_part_id: Optional[int] = None
+
+    amenity_ids: Optional[list[int]] = None
+    heating_ids: Optional[list[int]] = None
+
+    model_config = ConfigDict(extra="forbid")
+
 class BuildingOut(BuildingBase):
     id: int
 
-    estate_type: EstateTypeOut
-    offer: OfferOut
-    city_part: Optional[CityPartOut]
+    # Nullable like their columns: CSV imports leave the estate type unset
+    estate_type: Optional[EstateTypeOut] = None
+    offer: Optional[OfferOut] = None
+    city_part: Optional[CityPartOut] = None
 
     amenities: List[AmenityOut] = []
     heatings: List[HeatingOut] = []
 
     floor: Optional[BuildingFloorOut] = None
 
+    change_seq: Optional[int] = None        # row version, see /buildings/changes
+    updated_at: Optional[datetime] = None
+    archived: bool = False
+
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -59,6 +80,7 @@ class BuildingSearchQuery(BaseModel):
     parking: Optional[bool]     = Field(None, description="Whether parking is available")
     state: Optional[str]        = Field(None, description="Name of the state")
     estate_type: Optional[str]  = Field(None, description="Type of property: 'kuća' (house) or 'stan' (apartment)")
+    include_archived: bool      = Field(False, description="Also search listings moved to the archive")
 
     page: int = Field(1, ge=1, description="Page number (1‑indexed)")
     size: int = Field(10, ge=1, le=100, description="Results per page")
@@ -75,6 +97,42 @@ class BuildingSearchQuery(BaseModel):
         return self
 
 
+class BuildingChangesQuery(BaseModel):
+    """
+    Query parameters for the incremental change feed.
+    """
+
+    since: tuple[int, int] = Field((0, 0), description="`cursor` of the last change already seen "
+                                                       "by the consumer (`<xid>:<seq>`)")
+    limit: int = Field(1000, ge=1, le=10000, description="Maximum number of changes to return")
+
+    @field_validator("since", mode="before")
+    @classmethod
+    def parse_cursor(cls, value):
+        if isinstance(value, list) and len(value) == 1:
+            value = value[0]    # flask-pydantic passes tuple-typed query params as lists
+        if isinstance(value, str):
+            xid, sep, seq = value.partition(":")
+            if not sep or not xid.isdigit() or not seq.isdigit():
+                # not ValueError: flask-pydantic cannot serialize it into the 400 response
+                raise PydanticCustomError("cursor_format", "`since` must be a cursor of the form `<xid>:<seq>`")
+            return int(xid), int(seq)
+        return value
+
+
+class BuildingChangeOut(BaseModel):
+    """
+    One change feed entry: the current state of a changed building, or the
+    removal (archiving) of a building.
+    """
+
+    cursor: str                             # pass as `since` to resume after this entry
+    op: Literal["upsert", "delete"]
+    id: int
+    change_seq: int
+    building: Optional[BuildingOut] = None  # set for upserts
+
+
 class PaginatedBuildings(BaseModel):
     buildings: list[BuildingOut]
     total: int                   # total matching rows
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ExportFileOut(BaseModel):
+    name: str
+    format: str = Field(description="'parquet' or 'arrow'")
+    bytes: int
+    created_at: datetime
+
+
+class ExportListOut(BaseModel):
+    files: list[ExportFileOut]   # newest first
+
+
+class ExportTriggerOut(BaseModel):
+    job: str
+    next_run_time: datetime
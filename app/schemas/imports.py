@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field, computed_field
+
+
+class ImportRunOut(BaseModel):
+    """
+    Progress and throughput of a single CSV file import.
+    """
+
+    id: int
+    file: str
+    status: str = Field(description="'running', 'success' or 'error'")
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+
+    bytes: int = 0               # on disk, i.e. compressed size for archives
+    rows_read: int = 0
+    rows_filtered: int = Field(0, description="Rows dropped by the `status == 'for_sale'` filter")
+    rows_inserted: int = 0
+    rows_rejected: int = Field(0, description="Rows failing validation, written to `errors_files`")
+    rows_skipped: int = Field(0, description="Rows committed by an earlier run of the same file")
+
+    profile: Optional[str] = None       # import profile(s) used for the file
+    import_batches: list[str] = Field(default_factory=list,
+                                      description="`import_batch` of the committed rows, one per CSV")
+    errors_files: list[str] = Field(default_factory=list,
+                                    description="Quarantined rows, one file per CSV, in ERRORED_DIR")
+
+    stage_seconds: dict[str, float] = Field(default_factory=dict,
+                                            description="Duration per stage (read_csv, transform, db_write)")
+    error: Optional[str] = None
+
+    @computed_field
+    @property
+    def duration_seconds(self) -> float:
+        end = self.finished_at or datetime.now(self.started_at.tzinfo)
+        return (end - self.started_at).total_seconds()
+
+    @computed_field
+    @property
+    def rows_per_second(self) -> float:
+        duration = self.duration_seconds
+        return self.rows_read / duration if duration > 0 else 0.0
+
+
+class ImportStatusOut(BaseModel):
+    backlog_files: int           # files waiting in DATA_DIR
+    backlog_bytes: int           # their total size
+    running: list[ImportRunOut]
+    recent: list[ImportRunOut]   # most recent finished runs, newest first
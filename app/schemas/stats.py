@@ -0,0 +1,51 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+
+StatsDimension = Literal["state", "city", "estate_type", "offer"]
+
+
+class StatsQuery(BaseModel):
+    """
+    Query parameters for the statistics endpoint. Filters are names, as in
+    BuildingSearchQuery; `group_by` may be repeated or comma-separated.
+    """
+
+    state: Optional[str]       = Field(None, description="Name of the state")
+    city: Optional[str]        = Field(None, description="Name of the city")
+    estate_type: Optional[str] = Field(None, description="Type of property: 'kuća' (house) or 'stan' (apartment)")
+    offer: Optional[str]       = Field(None, description="Name of the offer")
+    group_by: list[StatsDimension] = Field(default_factory=list,
+                                           description="Dimensions to group by, e.g. 'state,estate_type'")
+
+    @field_validator("group_by", mode="before")
+    @classmethod
+    def split_group_by(cls, value):
+        if isinstance(value, str):
+            value = [value]
+        dimensions = [part.strip() for item in value or [] for part in item.split(",") if part.strip()]
+        return list(dict.fromkeys(dimensions))
+
+
+class MetricStatsOut(BaseModel):
+    n: int                     # listings with a known value
+    mean: Optional[float] = None
+    stddev: Optional[float] = None
+
+
+class StatsGroupOut(BaseModel):
+    state: Optional[str] = None
+    city: Optional[str] = None
+    estate_type: Optional[str] = None
+    offer: Optional[str] = None
+
+    count: int
+    price: MetricStatsOut
+    square_footage: MetricStatsOut
+    land_area: MetricStatsOut
+    price_per_sqm: MetricStatsOut
+
+
+class StatsOut(BaseModel):
+    groups: list[StatsGroupOut]
@@ -1,3 +1,24 @@
+import importlib
+
+from .metrics_service import MetricsService
+from .import_status_service import ImportStatusService
+from .capture_service import CaptureService
+from .rate_limit_service import RateLimitService, RateLimitBackend, InMemoryRateLimitBackend
+from .load_shedding_service import LoadSheddingService
+from .stats_service import StatsService
 from .building_service import BuildingService
-from .csv_service import CSVService
-from .auth_service import AuthService
\ No newline at end of file
+from .write_queue_service import WriteQueueService
+from .archive_service import ArchiveService
+from .export_service import ExportService
+from .auth_service import AuthService
+
+from .token_cache import CachingJWTManager, VerifiedTokenCache
+
+# Imported on first access: CSVService pulls in pandas and numpy, which
+# API-only processes never need.
+_LAZY = {"CSVService": ".csv_service"}
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
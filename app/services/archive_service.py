@@ -0,0 +1,156 @@
+from datetime import timedelta
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.database import transactional_session
+from app.services.metrics_service import MetricsService
+from app.services.stats_service import StatsService
+
+
+class ArchiveService:
+    """
+    Moves stale listings out of the hot `building` table into
+    `building_archive`, in small batches.
+
+    Each batch is a single statement that deletes the selected buildings
+    (and their amenity/heating rows) and inserts them, with their floor and
+    association ids denormalized, into the archive. Archived rows get a new
+    change sequence, which the change feed reports as deletes, and are
+    subtracted from the stats rollup in the same transaction.
+    """
+
+    RULES       = []
+    BATCH_SIZE  = None
+    MAX_BATCHES = None
+
+    _MOVE_SQL = """
+        WITH victims AS (
+            SELECT id FROM building
+            WHERE {where}
+            ORDER BY id
+            LIMIT :batch_size
+            FOR UPDATE SKIP LOCKED
+        ),
+        amenities AS (
+            DELETE FROM building_amenity ba USING victims v
+            WHERE ba.building_id = v.id
+            RETURNING ba.building_id, ba.amenity_id
+        ),
+        heatings AS (
+            DELETE FROM building_heating bh USING victims v
+            WHERE bh.building_id = v.id
+            RETURNING bh.building_id, bh.heating_id
+        ),
+        floors AS (
+            SELECT bf.* FROM building_floor bf JOIN victims v ON bf.building_id = v.id
+        ),
+        moved AS (
+            DELETE FROM building b USING victims v
+            WHERE b.id = v.id
+            RETURNING b.*
+        )
+        INSERT INTO building_archive (
+            id, square_footage, construction_year, land_area, registration, rooms,
+            bathrooms, parking, price, estate_type_id, offer_id, city_part_id,
+            import_batch, change_seq, change_xid, updated_at, floor_level, floor_total,
+            amenity_ids, heating_ids
+        )
+        SELECT
+            m.id, m.square_footage, m.construction_year, m.land_area, m.registration, m.rooms,
+            m.bathrooms, m.parking, m.price, m.estate_type_id, m.offer_id, m.city_part_id,
+            m.import_batch, nextval('building_change_seq'), pg_current_xact_id()::text::bigint,
+            m.updated_at, f.floor_level, f.floor_total,
+            coalesce((SELECT array_agg(a.amenity_id ORDER BY a.amenity_id)
+                      FROM amenities a WHERE a.building_id = m.id), '{{}}'),
+            coalesce((SELECT array_agg(h.heating_id ORDER BY h.heating_id)
+                      FROM heatings h WHERE h.building_id = m.id), '{{}}')
+        FROM moved m
+        LEFT JOIN floors f ON f.building_id = m.id
+        RETURNING id, city_part_id, estate_type_id, offer_id, price, square_footage, land_area
+    """
+
+    @classmethod
+    def init_app(cls, app):
+        """Pull in archive rules and batch limits."""
+        cfg = app.config
+        cls.RULES       = cfg["ARCHIVE_RULES"]
+        cls.BATCH_SIZE  = cfg["ARCHIVE_BATCH_SIZE"]
+        cls.MAX_BATCHES = cfg["ARCHIVE_MAX_BATCHES"]
+        cls.logger = app.logger
+
+    @staticmethod
+    def _where(rule: dict) -> tuple[str, dict]:
+        """
+        Translate an archive rule into a WHERE clause and its parameters.
+
+        Supported keys (all optional, combined with AND):
+            offer_id (int): Only listings with this offer.
+            import_batch (str): Only listings loaded by this CSV import.
+            imported_only (bool): Only listings loaded by any CSV import.
+            older_than_days (int): Only listings not updated for this long.
+        """
+        conditions, params = [], {}
+        if rule.get("offer_id") is not None:
+            conditions.append("offer_id = :offer_id")
+            params["offer_id"] = rule["offer_id"]
+        if rule.get("import_batch") is not None:
+            conditions.append("import_batch = :import_batch")
+            params["import_batch"] = rule["import_batch"]
+        if rule.get("imported_only"):
+            conditions.append("import_batch IS NOT NULL")
+        if rule.get("older_than_days") is not None:
+            conditions.append("updated_at < now() - :max_age")
+            params["max_age"] = timedelta(days=rule["older_than_days"])
+        if not conditions:
+            raise ValueError("An archive rule needs at least one criterion.")
+        return " AND ".join(conditions), params
+
+    @classmethod
+    def archive_batch(cls, db: Session, rule: dict, batch_size: int) -> list:
+        """
+        Move up to `batch_size` buildings matching `rule` to the archive.
+
+        Args:
+            db (Session): Active SQLAlchemy session; the caller commits.
+            rule (dict): Archive criteria, see `_where`.
+            batch_size (int): Maximum number of buildings to move.
+
+        Returns:
+            list: The archived rows (id and stats contribution columns).
+        """
+        where, params = cls._where(rule)
+        stmt = text(cls._MOVE_SQL.format(where=where))
+        rows = db.execute(stmt, {**params, "batch_size": batch_size}).all()
+        StatsService.apply(db, removed=[StatsService.contribution(row) for row in rows])
+        return rows
+
+    @classmethod
+    def archive(cls, rule: dict, batch_size: int | None = None,
+                max_batches: int | None = None) -> int:
+        """
+        Archive every building matching `rule`, one committed batch at a time
+        so locks are held briefly and searches are never blocked for long.
+
+        Returns:
+            int: Number of buildings archived.
+        """
+        batch_size = batch_size or cls.BATCH_SIZE
+        max_batches = max_batches or cls.MAX_BATCHES
+        archived = 0
+        for _ in range(max_batches):
+            with MetricsService.timer("archive_batch_seconds"):
+                with transactional_session() as db:
+                    rows = cls.archive_batch(db, rule, batch_size)
+            archived += len(rows)
+            MetricsService.inc("archived_buildings_total", len(rows))
+            if len(rows) < batch_size:
+                break
+        return archived
+
+    @classmethod
+    def run(cls) -> None:
+        """Apply every configured ARCHIVE_RULES entry. Scheduled as `archive_job`."""
+        for rule in cls.RULES:
+            archived = cls.archive(rule)
+            cls.logger.info(f"Archived {archived} buildings for rule {rule}")
@@ -1,16 +1,105 @@
-from flask import jsonify
+import hashlib
+import hmac
+import secrets
+from flask import jsonify, current_app
 from flask_jwt_extended import create_access_token
 from typing import Tuple
 from flask.wrappers import Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from werkzeug.security import check_password_hash, generate_password_hash
+from app.models import User
 from app.schemas import LoginRequest
 
 
 class AuthService:
+    """
+    Service class responsible for authentication.
+
+    Human users are stored with a salted, deliberately slow password hash.
+    Service accounts authenticate with a random high-entropy API key, which
+    is stored as a plain SHA-256 digest and checked in constant time; they
+    receive long-lived tokens so that batch integrations rarely log in.
+    """
+
+    SERVICE_KEY_PREFIX = "sha256$"
+
+    # Hash checked for unknown usernames, so they take as long as a wrong password.
+    _dummy_password_hash = None
 
     @classmethod
-    def login(cls, login_request: LoginRequest) -> Tuple[Response, int]:
-        if login_request.username != "rbt" or login_request.password != "rbt":
+    def login(cls, db: Session, login_request: LoginRequest) -> Tuple[Response, int]:
+        """
+        Verify credentials and issue an access token.
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            login_request (LoginRequest): Username and password (or API key
+                for service accounts).
+
+        Returns:
+            Tuple[Response, int]: `{"access_token": ...}` and 200, or an
+                error message and 401.
+        """
+        user = db.scalar(select(User).where(User.username == login_request.username))
+
+        if user is None:
+            cls._check_password(cls._get_dummy_password_hash(), login_request.password)
+            return jsonify({"msg": "Bad username or password"}), 401
+
+        if not cls._check_password(user.password_hash, login_request.password) or not user.is_active:
             return jsonify({"msg": "Bad username or password"}), 401
 
-        access_token = create_access_token(identity=login_request.username)
-        return jsonify(access_token=access_token), 200
\ No newline at end of file
+        if user.is_service:
+            access_token = create_access_token(
+                identity=user.username,
+                expires_delta=current_app.config["JWT_SERVICE_TOKEN_EXPIRES"],
+                additional_claims={"svc": True},
+            )
+        else:
+            access_token = create_access_token(identity=user.username)
+        return jsonify(access_token=access_token), 200
+
+    @classmethod
+    def create_user(cls, db: Session, username: str, password: str | None = None,
+                    is_service: bool = False) -> tuple[User, str]:
+        """
+        Add a user, or a service account when `is_service` is set.
+
+        Args:
+            db (Session): Active SQLAlchemy session.
+            username (str): Unique login name.
+            password (str | None): Password for human users. Ignored for
+                service accounts, which always get a generated API key.
+            is_service (bool): Create a service account.
+
+        Returns:
+            tuple[User, str]: The stored user and its password or API key
+                (the only time the API key is available in clear text).
+        """
+        if is_service:
+            secret = secrets.token_urlsafe(32)
+            password_hash = cls.SERVICE_KEY_PREFIX + hashlib.sha256(secret.encode()).hexdigest()
+        else:
+            if not password:
+                raise ValueError("A password is required for non-service users.")
+            secret = password
+            password_hash = generate_password_hash(password)
+
+        user = User(username=username, password_hash=password_hash, is_service=is_service)
+        db.add(user)
+        db.commit()
+        return user, secret
+
+    @classmethod
+    def _check_password(cls, password_hash: str, password: str) -> bool:
+        if password_hash.startswith(cls.SERVICE_KEY_PREFIX):
+            digest = hashlib.sha256(password.encode()).hexdigest()
+            return hmac.compare_digest(password_hash[len(cls.SERVICE_KEY_PREFIX):], digest)
+        return check_password_hash(password_hash, password)
+
+    @classmethod
+    def _get_dummy_password_hash(cls) -> str:
+        if cls._dummy_password_hash is None:
+            cls._dummy_password_hash = generate_password_hash(secrets.token_urlsafe(16))
+        return cls._dummy_password_hash
@@ -1,9 +1,18 @@
-from app.models import Building, EstateType, State, City, CityPart, Amenity, Heating
-from sqlalchemy.orm import Session
+from app.models import (Building, EstateType, State, City, CityPart, Amenity, Heating,
+                        BuildingAmenity, BuildingHeating, ArchivedBuilding)
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import select, and_, func, update
-from app.schemas import BuildingOut, BuildingSearchQuery, PaginatedBuildings, BuildingIn
+from sqlalchemy import (select, and_, func, update, insert, delete, literal, literal_column,
+                        tuple_, union_all)
+import heapq
+from itertools import islice
+from typing import Iterator
+from app.schemas import (BuildingOut, BuildingSearchQuery, PaginatedBuildings, BuildingIn,
+                         BuildingPatch, BuildingChangeOut)
+from app.schemas.building import BuildingFloorOut
+from app.schemas.taxonomy import AmenityOut, HeatingOut
 from flask import abort, jsonify, make_response
+from app.services.stats_service import StatsService
 
 
 
@@ -58,37 +67,82 @@ class BuildingService:
                 - size: Number of items per page.
                 - pages: Total number of available pages.
         """
-        stmt = select(Building)
+        if filters.include_archived:
+            return cls._search_with_archive(db, filters)
+
+        stmt = cls._apply_filters(select(Building), Building, filters)
+
+        #Pagination
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+        total = db.scalar(count_stmt) or 0
+
+        size = filters.size
+        pages = max((total + size - 1) // size, 1)
+
+        page = min(max(filters.page, 1), pages)
+        offset = (page - 1) * size
+
+        paged_stmt = stmt.order_by(Building.id).limit(size).offset(offset)
+
+        results = db.scalars(paged_stmt).all()
+        buildings_out = [BuildingOut.model_validate(building_orm) for building_orm in results]
+
+
+        return PaginatedBuildings(
+            buildings=buildings_out,
+            total=total,
+            page=page,
+            size=size,
+            pages=pages
+        )
+
+    @staticmethod
+    def _apply_filters(stmt, model, filters: BuildingSearchQuery):
+        """
+        Add the search filters to `stmt`. `model` is Building or
+        ArchivedBuilding, which share columns and relationships.
+        """
         conditions = []
-        
+
         if filters.estate_type is not None:
-            stmt = stmt.join(Building.estate_type)
+            stmt = stmt.join(model.estate_type)
             conditions.append(EstateType.name == filters.estate_type)
-            
+
         if filters.state is not None:
             stmt = (
                 stmt
-                .join(Building.city_part)
+                .join(model.city_part)
                 .join(CityPart.city)
                 .join(City.state)
             )
             conditions.append(State.name == filters.state)
-        
+
         if filters.min_sqft is not None:
-            conditions.append(Building.square_footage >= filters.min_sqft)
-        
+            conditions.append(model.square_footage >= filters.min_sqft)
+
         if filters.max_sqft is not None:
-            conditions.append(Building.square_footage <= filters.max_sqft)
-        
+            conditions.append(model.square_footage <= filters.max_sqft)
+
         if filters.parking is not None:
-            conditions.append(Building.parking == filters.parking)
-        
+            conditions.append(model.parking == filters.parking)
+
         if conditions:
             stmt = stmt.where(and_(*conditions))
+        return stmt
 
-        #Pagination
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = db.scalar(count_stmt) or 0
+    @classmethod
+    def _search_with_archive(cls, db: Session, filters: BuildingSearchQuery) -> PaginatedBuildings:
+        """
+        Search hot and archived listings together. Only ids are paginated
+        over the union; the page's rows are then loaded from each table.
+        """
+        matches = union_all(
+            cls._apply_filters(select(Building.id, literal(False).label("archived")), Building, filters),
+            cls._apply_filters(select(ArchivedBuilding.id, literal(True).label("archived")),
+                               ArchivedBuilding, filters),
+        ).subquery()
+
+        total = db.scalar(select(func.count()).select_from(matches)) or 0
 
         size = filters.size
         pages = max((total + size - 1) // size, 1)
@@ -96,20 +150,67 @@ class BuildingService:
         page = min(max(filters.page, 1), pages)
         offset = (page - 1) * size
 
-        paged_stmt = stmt.order_by(Building.id).limit(size).offset(offset)
+        page_rows = db.execute(
+            select(matches.c.id, matches.c.archived)
+            .order_by(matches.c.id).limit(size).offset(offset)
+        ).all()
 
-        results = db.scalars(paged_stmt).all()
-        buildings_out = [BuildingOut.model_validate(building_orm) for building_orm in results]
+        hot_ids = [row.id for row in page_rows if not row.archived]
+        archived_ids = [row.id for row in page_rows if row.archived]
 
+        by_id = {}
+        if hot_ids:
+            stmt = select(Building).where(Building.id.in_(hot_ids)).options(*cls._out_options())
+            by_id.update((b.id, BuildingOut.model_validate(b)) for b in db.scalars(stmt))
+        if archived_ids:
+            by_id.update((b.id, b) for b in cls._archived_out(db, archived_ids))
 
         return PaginatedBuildings(
-            buildings=buildings_out,
+            buildings=[by_id[row.id] for row in page_rows],
             total=total,
             page=page,
             size=size,
             pages=pages
         )
 
+    @classmethod
+    def _archived_out(cls, db: Session, archived_ids: list[int]) -> list[BuildingOut]:
+        """
+        Serialize archived buildings, resolving their denormalized
+        amenity/heating ids with one query per taxonomy.
+        """
+        stmt = (
+            select(ArchivedBuilding)
+            .where(ArchivedBuilding.id.in_(archived_ids))
+            .options(
+                joinedload(ArchivedBuilding.estate_type),
+                joinedload(ArchivedBuilding.offer),
+                joinedload(ArchivedBuilding.city_part).joinedload(CityPart.city).joinedload(City.state),
+            )
+        )
+        archived = db.scalars(stmt).all()
+
+        amenities = {a.id: AmenityOut.model_validate(a) for a in db.scalars(
+            select(Amenity).where(Amenity.id.in_({i for b in archived for i in b.amenity_ids})))}
+        heatings = {h.id: HeatingOut.model_validate(h) for h in db.scalars(
+            select(Heating).where(Heating.id.in_({i for b in archived for i in b.heating_ids})))}
+
+        buildings_out = []
+        for b in archived:
+            floor = None
+            if b.floor_level is not None or b.floor_total is not None:
+                floor = BuildingFloorOut(building_id=b.id, floor_level=b.floor_level,
+                                         floor_total=b.floor_total)
+            buildings_out.append(BuildingOut.model_validate({
+                **{field: getattr(b, field) for field in BuildingOut.model_fields
+                   if field not in ("amenities", "heatings", "floor", "archived")},
+                "amenities": [amenities[i] for i in b.amenity_ids if i in amenities],
+                "heatings": [heatings[i] for i in b.heating_ids if i in heatings],
+                "floor": floor,
+                "archived": True,
+            }))
+        return buildings_out
+
     @classmethod
     def create(cls, db: Session, building_in: BuildingIn) -> BuildingOut:
         """
@@ -162,6 +263,8 @@ class BuildingService:
 
         try:
             db.add(new_building_orm)
+            db.flush()
+            StatsService.apply(db, added=[StatsService.contribution(new_building_orm)])
             db.commit()
             db.refresh(new_building_orm)
 
@@ -198,7 +301,9 @@ class BuildingService:
                 - If any of the provided `amenity_ids` or `heating_ids` cannot be found.
             400: On database integrity errors (e.g. unique constraint or foreign key violations).
         """
-        building_orm = db.get(Building, building_id)
+        # Lock the row first (as patch does), so the old stats contribution
+        # stays current and the building is locked before any stats group.
+        building_orm = db.get(Building, building_id, with_for_update=True, populate_existing=True)
         if building_orm is None:
             payload = {
                 "error": "Building not found",
@@ -212,9 +317,14 @@ class BuildingService:
         amenity_ids = update_data.pop("amenity_ids", None)
         heating_ids = update_data.pop("heating_ids", None)
 
+        old_contribution = StatsService.contribution(building_orm)
         for field, value in update_data.items():
             setattr(building_orm, field, value)
 
+        # Always write the row, so that amenity/heating-only changes
+        # still bump `change_seq` (set by its onupdate default).
+        building_orm.updated_at = func.now()
+
         if amenity_ids:
             stmt = select(Amenity).where(Amenity.id.in_(amenity_ids))
             building_orm.amenities = db.scalars(stmt).all()
@@ -247,6 +357,9 @@ class BuildingService:
                 abort(make_response(jsonify(payload), 404))
 
         try:
+            db.flush()
+            StatsService.apply(db, added=[StatsService.contribution(building_orm)],
+                               removed=[old_contribution])
             db.commit()
             db.refresh(building_orm)
             return BuildingOut.model_validate(building_orm)
@@ -260,10 +373,251 @@ class BuildingService:
             }
             abort(make_response(jsonify(payload), 400))
 
+    @classmethod
+    def patch(cls, db: Session, building_id: int, building_patch: BuildingPatch) -> BuildingOut:
+        """
+        Partially update a Building, writing only what changed.
+
+        Scalar fields are written with a single `UPDATE ... RETURNING`.
+        Amenity/heating sets are diffed against the stored association rows,
+        so only added rows are inserted and only removed rows are deleted.
+        The old row is only read (and locked) when a field tracked by the
+        stats rollup changes.
+
+        Args:
+            db (Session): Active SQLAlchemy session.
+            building_id (int): ID of the building to update.
+            building_patch (BuildingPatch): Fields to change; unset fields
+                are left untouched.
+
+        Returns:
+            BuildingOut: The updated building with its current relations.
+
+        Raises:
+            404:
+                - If no Building with the given `building_id` exists.
+                - If any newly added amenity or heating ID cannot be found.
+            400: On database integrity errors (e.g. foreign key violations).
+        """
+        update_data = building_patch.model_dump(exclude_unset=True)
+        amenity_ids = update_data.pop("amenity_ids", None)
+        heating_ids = update_data.pop("heating_ids", None)
+
+        stats_columns = [getattr(Building, column) for column in StatsService.COLUMNS]
+
+        try:
+            old_contribution = None
+            if update_data.keys() & set(StatsService.COLUMNS):
+                # Old values for the stats rollup; the lock keeps them current
+                # until the UPDATE below.
+                old_contribution = db.execute(
+                    select(*stats_columns).where(Building.id == building_id).with_for_update()
+                ).one_or_none()
+
+            if update_data or amenity_ids is not None or heating_ids is not None:
+                # Empty `values()` still sets change_seq/updated_at via onupdate.
+                stmt = (
+                    update(Building)
+                    .where(Building.id == building_id)
+                    .values(**update_data)
+                    .returning(Building.id, *stats_columns)
+                    .execution_options(synchronize_session=False)
+                )
+                updated = db.execute(stmt).one_or_none()
+                found_id = updated.id if updated is not None else None
+            else:
+                found_id = db.scalar(select(Building.id).where(Building.id == building_id))
+
+            if found_id is None:
+                db.rollback()
+                payload = {
+                    "error": "Building not found",
+                    "id": building_id,
+                    "message": f"Building with ID {building_id} not found"
+                }
+                abort(make_response(jsonify(payload), 404))
+
+            if old_contribution is not None:
+                StatsService.apply(db, added=[StatsService.contribution(updated)],
+                                   removed=[old_contribution])
+
+            if amenity_ids is not None:
+                cls._sync_links(db, building_id, BuildingAmenity.amenity_id,
+                                Amenity, amenity_ids, "Amenity")
+            if heating_ids is not None:
+                cls._sync_links(db, building_id, BuildingHeating.heating_id,
+                                Heating, heating_ids, "Heating")
+
+            db.commit()
+
+        except IntegrityError as e:
+            db.rollback()
+            payload = {
+                "error": "Database integrity error",
+                "details": str(e.__cause__ or e),
+                "hint": "Check foreign keys or unique constraints",
+            }
+            abort(make_response(jsonify(payload), 400))
+
+        return cls._load_out(db, building_id)
+
+    @classmethod
+    def _sync_links(cls, db: Session, building_id: int, link_column, target_model,
+                    requested_ids: list[int], label: str) -> None:
+        """
+        Make the building's association rows match `requested_ids`,
+        inserting and deleting only the difference.
+
+        Args:
+            link_column: Target-id column of the association table
+                (e.g. `BuildingAmenity.amenity_id`).
+            target_model: Model the ids refer to, used to validate new ids.
+            label (str): Name used in the 404 payload ("Amenity", "Heating").
+        """
+        link_model = link_column.class_
+        current = set(db.scalars(
+            select(link_column).where(link_model.building_id == building_id)
+        ))
+        requested = set(requested_ids)
+        added = requested - current
+        removed = current - requested
+
+        if added:
+            found = set(db.scalars(select(target_model.id).where(target_model.id.in_(added))))
+            missing = added - found
+            if missing:
+                db.rollback()
+                payload = {
+                    "error": f"{label} ID(s) not found",
+                    "missing_ids": sorted(missing)
+                }
+                abort(make_response(jsonify(payload), 404))
+
+        if removed:
+            db.execute(
+                delete(link_model)
+                .where(link_model.building_id == building_id, link_column.in_(removed))
+                .execution_options(synchronize_session=False)
+            )
+        if added:
+            db.execute(insert(link_model), [
+                {"building_id": building_id, link_column.key: target_id} for target_id in added
+            ])
+
+    @classmethod
+    def _load_out(cls, db: Session, building_id: int) -> BuildingOut:
+        """
+        Load a building and all relations serialized by BuildingOut in a
+        fixed number of queries, replacing refresh plus lazy loads.
+        """
+        stmt = (
+            select(Building)
+            .where(Building.id == building_id)
+            .options(*cls._out_options())
+            .execution_options(populate_existing=True)
+        )
+        return BuildingOut.model_validate(db.scalars(stmt).one())
+
+    @staticmethod
+    def _out_options() -> tuple:
+        """Loader options for every relation serialized by BuildingOut."""
+        return (
+            joinedload(Building.estate_type),
+            joinedload(Building.offer),
+            joinedload(Building.city_part).joinedload(CityPart.city).joinedload(City.state),
+            joinedload(Building.floor),
+            selectinload(Building.amenities),
+            selectinload(Building.heatings),
+        )
+
+    @classmethod
+    def changes_since(cls, db: Session, since: tuple[int, int], limit: int,
+                      batch_size: int = 500) -> Iterator[BuildingChangeOut]:
+        """
+        Yield changes after the cursor `since`, ordered by the writing
+        transaction's id and then `change_seq`.
+
+        Sequence values are drawn when a row is written, not when it
+        commits, so ordering by `change_seq` alone would let a long
+        transaction commit lower values behind a consumer's cursor. Changes
+        are therefore only returned once their transaction and every
+        transaction with a lower id have finished (`pg_snapshot_xmin`): a
+        change can never appear behind a returned cursor. The feed lags
+        behind the oldest write transaction still in progress in the
+        database.
+
+        Upserts are read through the `(change_xid, change_seq)` index with a
+        server-side cursor, in batches of `batch_size`. Archived buildings
+        are reported as deletes, read from the same index on the archive.
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            since (tuple[int, int]): (xid, seq) of the last change already
+                seen by the consumer.
+            limit (int): Maximum number of changes to yield.
+            batch_size (int): Rows fetched per round trip.
+
+        Yields:
+            BuildingChangeOut: The current state of each changed building,
+                or the deletion of an archived one.
+        """
+        watermark = db.scalar(select(literal_column("pg_snapshot_xmin(pg_current_snapshot())::text::bigint")))
+
+        def window(model):
+            return and_(tuple_(model.change_xid, model.change_seq) > tuple_(*since),
+                        model.change_xid < watermark)
+
+        upserts = db.scalars(
+            select(Building)
+            .where(window(Building))
+            .order_by(Building.change_xid, Building.change_seq)
+            .limit(limit)
+            .options(*cls._out_options())
+            .execution_options(yield_per=batch_size)
+        )
+        deletes = db.execute(
+            select(ArchivedBuilding.id, ArchivedBuilding.change_xid, ArchivedBuilding.change_seq)
+            .where(window(ArchivedBuilding))
+            .order_by(ArchivedBuilding.change_xid, ArchivedBuilding.change_seq)
+            .limit(limit)
+        ).all()
+
+        changes = heapq.merge(
+            ((b.change_xid, b.change_seq, b.id, b) for b in upserts),
+            ((row.change_xid, row.change_seq, row.id, None) for row in deletes),
+            key=lambda change: change[:2],
+        )
+        for xid, seq, building_id, building_orm in islice(changes, limit):
+            yield BuildingChangeOut(
+                cursor=f"{xid}:{seq}",
+                op="upsert" if building_orm is not None else "delete",
+                id=building_id,
+                change_seq=seq,
+                building=BuildingOut.model_validate(building_orm) if building_orm is not None else None,
+            )
+
     @classmethod
     def bulk_create(cls, db: Session, buildings_orm: list[Building]):
         """
-        Add a batch of Building ORM objects to the given session and flush them.
+        Add a batch of Building ORM objects to the given session and flush them,
+        adding them to the stats rollup in the same transaction.
         """
         db.add_all(buildings_orm)
         db.flush()
+        StatsService.apply(db, added=[StatsService.contribution(b) for b in buildings_orm])
+
+    @classmethod
+    def bulk_link(cls, db: Session, link_column, pairs: list[tuple[int, int]]) -> None:
+        """
+        Insert association rows for a batch of buildings with one executemany.
+
+        Args:
+            link_column: Target-id column of the association table
+                (e.g. `BuildingAmenity.amenity_id`).
+            pairs (list[tuple[int, int]]): (building_id, target_id) pairs.
+        """
+        if pairs:
+            db.execute(insert(link_column.class_), [
+                {"building_id": building_id, link_column.key: target_id}
+                for building_id, target_id in pairs
+            ])
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import logging
+import os
+import random
+import time
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from flask import g, request
+
+
+class CaptureService:
+    """
+    Records a sample of incoming requests to a JSONL file for later replay.
+
+    Each line holds the method, path, query, a SHA-256 of the body, the
+    latency and the response status. Bodies themselves are never stored.
+
+    Every process writes its own file, `<CAPTURE_PATH stem>.<pid><suffix>`
+    (e.g. `requests.1234.jsonl`), rotated by size: size-based rotation is
+    not safe with several processes appending to one file.
+    """
+
+    ENABLED      = False
+    SAMPLE_RATE  = None
+    PATH         = None
+    MAX_BYTES    = None
+    BACKUP_COUNT = None
+
+    _logger = logging.getLogger("app.capture")
+    _pid = None     # process the logger's file handler was opened in
+
+    @classmethod
+    def init_app(cls, app):
+        """Pull in capture settings and register the request hooks."""
+        cfg = app.config
+        cls.ENABLED     = cfg["CAPTURE_ENABLED"]
+        cls.SAMPLE_RATE = cfg["CAPTURE_SAMPLE_RATE"]
+        cls.PATH        = Path(cfg["CAPTURE_PATH"])
+        cls.MAX_BYTES    = cfg["CAPTURE_MAX_BYTES"]
+        cls.BACKUP_COUNT = cfg["CAPTURE_BACKUP_COUNT"]
+
+        if not cls.ENABLED:
+            return
+
+        cls.PATH.parent.mkdir(parents=True, exist_ok=True)
+        cls._logger.setLevel(logging.INFO)
+        cls._logger.propagate = False
+
+        app.before_request(cls._start_capture)
+        app.after_request(cls._record)
+
+        app.logger.info(f"Request capture enabled: PATH={cls.PATH}, SAMPLE_RATE={cls.SAMPLE_RATE}")
+
+    @classmethod
+    def process_path(cls) -> Path:
+        """Capture file of the current process."""
+        return cls.PATH.with_name(f"{cls.PATH.stem}.{os.getpid()}{cls.PATH.suffix}")
+
+    @classmethod
+    def _open_handler(cls) -> None:
+        """
+        (Re)open the capture file for the current process. Called on first
+        use, so workers forked after init_app (e.g. gunicorn --preload) get
+        their own file instead of the parent's.
+        """
+        for handler in cls._logger.handlers:
+            handler.close()
+        handler = RotatingFileHandler(
+            cls.process_path(),
+            maxBytes=cls.MAX_BYTES,
+            backupCount=cls.BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        cls._logger.handlers = [handler]
+        cls._pid = os.getpid()
+
+    @classmethod
+    def _start_capture(cls):
+        if random.random() < cls.SAMPLE_RATE:
+            g.capture_started_at = time.perf_counter()
+
+    @classmethod
+    def _record(cls, response):
+        started_at = g.pop("capture_started_at", None)
+        if started_at is None:
+            return response
+
+        body = request.get_data(cache=True)
+        record = {
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "method": request.method,
+            "path": request.path,
+            "endpoint": request.endpoint,
+            "query": request.args.to_dict(flat=False),
+            "body_sha256": hashlib.sha256(body).hexdigest() if body else None,
+            "latency_ms": round((time.perf_counter() - started_at) * 1000, 3),
+            "status": response.status_code,
+        }
+        if cls._pid != os.getpid():
+            cls._open_handler()
+        cls._logger.info(json.dumps(record, ensure_ascii=False))
+        return response
@@ -1,9 +1,21 @@
+import hashlib
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
+import time
 import pandas as pd
-from app.models import Building
+from werkzeug.utils import import_string
+from app.models import Building, BuildingFloor, BuildingAmenity, BuildingHeating, ImportProgress
+from app.schemas import ImportRunOut
+from app.schemas.building import BuildingBase
 import shutil
+from app import database
 from app.database import transactional_session
-from app.services import BuildingService
+from app.services import BuildingService, MetricsService, ImportStatusService
+from app.services.import_lookup import ImportLookup
+from app.services.import_profiles import ImportProfile
+from app.services.import_readers import csv_sources, matches_any
+from app.services.import_validation import FrameValidator
 import numpy as np
 import logging
 
@@ -18,6 +30,18 @@ class CSVService:
     NEURO_PER_USD = None
     SQM_PER_ACRE  = None
     SQM_PER_SQFT  = None
+    PROFILES: list[ImportProfile] = []
+    PATTERNS       = None
+    CHUNK_ROWS     = None
+    MMAP_MIN_BYTES = None
+
+    # Building columns an import profile may provide, besides BuildingBase fields
+    _ID_COLUMNS = ("estate_type_id", "offer_id", "city_part_id")
+    _validator = FrameValidator(extra_fields={
+        **{column: int for column in _ID_COLUMNS},
+        "floor_level": str,
+        "floor_total": int,
+    })
 
     @classmethod
     def init_app(cls, app):
@@ -29,6 +53,10 @@ class CSVService:
         cls.NEURO_PER_USD   = cfg["NEURO_PER_USD"]
         cls.SQM_PER_ACRE  = cfg["SQM_PER_ACRE"]
         cls.SQM_PER_SQFT  = cfg["SQM_PER_SQFT"]
+        cls.PROFILES      = [import_string(profile)(cfg) for profile in cfg["IMPORT_PROFILES"]]
+        cls.PATTERNS       = cfg["IMPORT_PATTERNS"]
+        cls.CHUNK_ROWS     = cfg["IMPORT_CHUNK_ROWS"]
+        cls.MMAP_MIN_BYTES = cfg["IMPORT_MMAP_MIN_BYTES"]
 
         # grab Flask's logger
         cls.logger = app.logger
@@ -46,22 +74,88 @@ class CSVService:
             Path(directory).mkdir(parents=True, exist_ok=True)
 
     @classmethod
-    def _clean_transform(cls, df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Filter rows for sale and compute the desired columns.
-        """
-        return (
-            df.query("status == 'for_sale'")
-              .loc[:, ['price', 'bed', 'bath', 'acre_lot', 'house_size']]
-              .assign(
-                  price=lambda d: d.price * cls.NEURO_PER_USD,
-                  rooms=lambda d: d.bed.astype('Float64'),
-                  bathrooms=lambda d: d.bath.astype('Int64'),
-                  land_area=lambda d: d.acre_lot * cls.SQM_PER_ACRE,
-                  square_footage=lambda d: d.house_size * cls.SQM_PER_SQFT,
-              )
-              .loc[:, ['price', 'rooms', 'bathrooms', 'land_area', 'square_footage']]
-        )
+    def _profile_for(cls, name: str) -> ImportProfile:
+        """First configured import profile matching the CSV file name."""
+        for profile in cls.PROFILES:
+            if profile.matches(name):
+                return profile
+        raise ValueError(f"No import profile matches {name}")
+
+    @classmethod
+    def _clean_transform(cls, df: pd.DataFrame, profile: ImportProfile,
+                         lookup: ImportLookup) -> tuple[pd.DataFrame, pd.Series]:
+        """
+        Map `df` through `profile`, validate it against the BuildingBase
+        constraints and resolve names to ids, all column-wise.
+
+        Returns:
+            tuple: The transformed frame (source index kept) and the error
+                text per row, empty for valid rows.
+        """
+        frame = profile.transform(df)
+        errors = pd.Series("", index=frame.index, dtype=object)
+        frame = cls._validator.validate(frame, errors)
+        frame = lookup.resolve(frame, errors)
+        return frame, errors
+
+    @classmethod
+    def _to_buildings(cls, frame: pd.DataFrame, import_batch: str) -> tuple[list[Building], list, list]:
+        """
+        Build ORM objects from valid rows.
+
+        Returns:
+            tuple: The buildings, and the amenity and heating id lists of
+                each building (same order).
+        """
+        columns = [c for c in (*BuildingBase.model_fields, *cls._ID_COLUMNS) if c in frame]
+        has_floor = "floor_level" in frame or "floor_total" in frame
+
+        buildings, amenity_ids, heating_ids = [], [], []
+        for rec in frame.to_dict(orient="records"):
+            building = Building(import_batch=import_batch,
+                                **{c: cls._to_python(rec[c]) for c in columns})
+            if has_floor:
+                floor_level = cls._to_python(rec.get("floor_level"))
+                floor_total = cls._to_python(rec.get("floor_total"), int)
+                if floor_level is not None or floor_total is not None:
+                    building.floor = BuildingFloor(floor_level=floor_level, floor_total=floor_total)
+            buildings.append(building)
+            amenity_ids.append(rec.get("amenity_ids") or [])
+            heating_ids.append(rec.get("heating_ids") or [])
+        return buildings, amenity_ids, heating_ids
+
+    @classmethod
+    def _quarantine(cls, run: ImportRunOut, label: str, rows: pd.DataFrame, errors: pd.Series) -> None:
+        """
+        Append rejected source rows, with their line number and errors, to
+        `<label>.errors.csv` in ERRORED_DIR.
+        """
+        errors_path = cls._errors_path(label)
+        first = errors_path.name not in run.errors_files
+        quarantined = rows.assign(errors=errors.str.rstrip("; "))
+        quarantined.index = quarantined.index + 2   # 1-based line number, after the header
+        quarantined.to_csv(errors_path, mode="w" if first else "a", header=first, index_label="line")
+        if first:
+            run.errors_files.append(errors_path.name)
+        run.rows_rejected += len(rows)
+
+    @classmethod
+    def _errors_path(cls, label: str) -> Path:
+        return cls.ERRORED_DIR / f"{label.replace('/', '__')}.errors.csv"
+
+    @staticmethod
+    def _sha256(path: Path) -> str:
+        with path.open("rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    @classmethod
+    def _progress(cls, source: str, label: str) -> tuple[str | None, int]:
+        """`import_batch` and committed row count of an earlier run of this CSV, if any."""
+        with database.SessionLocal() as db:
+            progress = db.get(ImportProgress, (source, label))
+        if progress is None:
+            return None, 0
+        return progress.import_batch, progress.rows_done
 
     @staticmethod
     def _to_python(v: any, target: type | None = None) -> any:
@@ -82,44 +176,147 @@ class CSVService:
     @classmethod
     def import_all(cls) -> None:
         """
-        Process every CSV in DATA_DIR and move it based on result.
+        Process every file matching IMPORT_PATTERNS (in any case) in
+        DATA_DIR and move it based on result.
         """
         cls.logger.info("Starting import_all")
-        for csv_path in cls.DATA_DIR.glob("*.csv"):
-            destination = cls._process_file(csv_path)
-            cls._move_file(csv_path, destination)
+        paths = sorted(p for p in cls.DATA_DIR.iterdir() if p.is_file() and matches_any(p.name, cls.PATTERNS))
+        MetricsService.set_gauge("import_backlog_files", len(paths))
+        MetricsService.set_gauge("import_backlog_bytes", sum(p.stat().st_size for p in paths))
+
+        for path in paths:
+            destination = cls._process_file(path)
+            cls._move_file(path, destination)
         cls.logger.info("Finished import_all")
 
     @classmethod
     def _process_file(cls, path: Path) -> Path:
+        """
+        Import every CSV in `path` (a plain, compressed or zip file), chunk
+        by chunk, committing each chunk in its own transaction.
+
+        Short transactions keep the change feed current and the stats rows
+        unlocked for API writes. If the file fails, the chunks committed so
+        far stay imported: they are listed in the run's `import_batches`
+        and can be withdrawn with `flask archive run --import-batch`.
+
+        Each chunk also records how many source rows of its CSV are done
+        (`ImportProgress`, keyed by the file's SHA-256), so dropping the
+        same file again resumes after the last committed chunk, under the
+        same `import_batch`, and a completely imported file adds nothing.
+        """
+        run = ImportStatusService.start(path)
+        MetricsService.inc("import_bytes_total", run.bytes)
         try:
             cls.logger.info(f"Processing {path.name}")
-            df = pd.read_csv(path)
-            df_clean = cls._clean_transform(df)
-
-
-            buildings = [
-                Building(
-                    offer_id=1,
-                    price=cls._to_python(rec['price'], float),
-                    rooms=cls._to_python(rec['rooms'], float),
-                    bathrooms=cls._to_python(rec['bathrooms'], int),
-                    land_area=cls._to_python(rec['land_area'], float),
-                    square_footage=cls._to_python(rec['square_footage'], float),
-                )
-                for rec in df_clean.to_dict(orient="records")
-            ]
+            with cls._stage(run, "transform"), database.SessionLocal() as db:
+                lookup = ImportLookup(db)
+            with cls._stage(run, "read_csv"):
+                source = cls._sha256(path)
+
+            for label, name, chunks in csv_sources(path, cls.CHUNK_ROWS, cls.MMAP_MIN_BYTES):
+                profile = cls._profile_for(name)
+                if run.profile is None:
+                    run.profile = profile.name
+                elif profile.name not in run.profile.split(","):
+                    run.profile += f",{profile.name}"
 
-            with transactional_session() as db:
-                BuildingService.bulk_create(db=db, buildings_orm=buildings)
+                import_batch, rows_done = cls._progress(source, label)
+                if import_batch is None:
+                    import_batch = f"{run.started_at:%Y%m%dT%H%M%S}-{label}"
+                else:
+                    cls.logger.info(f" → Resuming {label} after {rows_done} committed rows")
+                    if cls._errors_path(label).exists():
+                        run.errors_files.append(cls._errors_path(label).name)
 
-            cls.logger.info(f" → Success processing {path.name}")
+                for df in cls._timed(run, "read_csv", chunks):
+                    if df.index[-1] < rows_done:
+                        run.rows_skipped += len(df)
+                        continue
+                    if df.index[0] < rows_done:
+                        run.rows_skipped += rows_done - df.index[0]
+                        df = df.loc[rows_done:]
+                    cls._import_chunk(run, source, label, df, profile, lookup, import_batch)
+
+            MetricsService.inc("import_rows_read_total", run.rows_read)
+            MetricsService.inc("import_rows_filtered_total", run.rows_filtered)
+            MetricsService.inc("import_rows_rejected_total", run.rows_rejected)
+            MetricsService.inc("import_rows_inserted_total", run.rows_inserted)
+            MetricsService.inc("import_files_total", status="success")
+            ImportStatusService.finish(run)
+
+            cls.logger.info(
+                f" → Success processing {path.name}: {run.rows_inserted}/{run.rows_read} rows "
+                f"({run.rows_rejected} rejected) "
+                f"in {run.duration_seconds:.2f}s ({run.rows_per_second:.0f} rows/s)"
+            )
             return cls.PROCESSED_DIR / path.name
 
         except Exception as e:
+            MetricsService.inc("import_files_total", status="error")
+            ImportStatusService.finish(run, error=e)
             cls.logger.error(f"Error processing {path.name}: {e}", exc_info=True)
+            if run.rows_inserted:
+                cls.logger.error(
+                    f" → {run.rows_inserted} rows of {path.name} were already committed, "
+                    f"in import batches {run.import_batches}; dropping the file again resumes after them"
+                )
             return cls.ERRORED_DIR / path.name
 
+    @classmethod
+    def _import_chunk(cls, run: ImportRunOut, source: str, label: str, df: pd.DataFrame,
+                      profile: ImportProfile, lookup: ImportLookup, import_batch: str) -> None:
+        """
+        Transform, validate and write one chunk in its own transaction,
+        together with the CSV's progress. Rejected rows are quarantined and
+        the run's counters updated only once the chunk has committed.
+        """
+        with cls._stage(run, "transform"):
+            frame, errors = cls._clean_transform(df, profile, lookup)
+            rejected = errors != ""
+            buildings, amenity_ids, heating_ids = cls._to_buildings(frame[~rejected], import_batch)
+
+        with cls._stage(run, "db_write"), transactional_session() as db:
+            BuildingService.bulk_create(db=db, buildings_orm=buildings)
+            BuildingService.bulk_link(db, BuildingAmenity.amenity_id, [
+                (b.id, i) for b, ids in zip(buildings, amenity_ids) for i in ids])
+            BuildingService.bulk_link(db, BuildingHeating.heating_id, [
+                (b.id, i) for b, ids in zip(buildings, heating_ids) for i in ids])
+            db.merge(ImportProgress(source_sha256=source, label=label, import_batch=import_batch,
+                                    rows_done=int(df.index[-1]) + 1))
+
+        run.rows_read += len(df)
+        run.rows_filtered += len(df) - len(frame)
+        run.rows_inserted += len(buildings)
+        if buildings and import_batch not in run.import_batches:
+            run.import_batches.append(import_batch)
+        if rejected.any():
+            cls._quarantine(run, label, df.loc[frame.index[rejected]], errors[rejected])
+
+    @classmethod
+    def _timed(cls, run: ImportRunOut, stage: str, chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Yield from `chunks`, timing each read as `stage`."""
+        while True:
+            with cls._stage(run, stage):
+                chunk = next(chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+    @staticmethod
+    @contextmanager
+    def _stage(run: ImportRunOut, stage: str) -> Iterator[None]:
+        """
+        Time one stage of an import, both on the run and in the metrics registry.
+        """
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started_at
+            run.stage_seconds[stage] = run.stage_seconds.get(stage, 0.0) + elapsed
+            MetricsService.observe("import_stage_seconds", elapsed, stage=stage)
+
     @staticmethod
     def _move_file(src: Path, dest: Path) -> None:
         dest.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,224 @@
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import text
+
+from app import database
+from app.services.metrics_service import MetricsService
+
+
+class ExportService:
+    """
+    Writes denormalized snapshots of the building table to Parquet and/or
+    Arrow IPC files for offline analysis.
+
+    Rows are read through a server-side cursor, EXPORT_BATCH_SIZE at a time,
+    and every batch is appended to the open writers, so memory use does not
+    depend on the table size. Files are written under a temporary name and
+    renamed when complete; only the newest EXPORT_KEEP snapshots are kept.
+
+    pyarrow is imported on first use, so API workers never load it.
+    """
+
+    DIR        = None
+    FORMATS    = []
+    BATCH_SIZE = None
+    KEEP       = None
+
+    EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+    _SNAPSHOT_SQL = """
+        SELECT
+            b.id, b.square_footage, b.construction_year, b.land_area, b.registration,
+            b.rooms, b.bathrooms, b.parking, b.price,
+            et.name AS estate_type, o.name AS offer,
+            cp.name AS city_part, c.name AS city, s.name AS state,
+            bf.floor_level, bf.floor_total,
+            ARRAY(SELECT a.name FROM building_amenity ba JOIN amenity a ON a.id = ba.amenity_id
+                  WHERE ba.building_id = b.id ORDER BY a.name) AS amenities,
+            ARRAY(SELECT h.name FROM building_heating bh JOIN heating h ON h.id = bh.heating_id
+                  WHERE bh.building_id = b.id ORDER BY h.name) AS heatings,
+            b.import_batch, b.change_seq, b.updated_at
+        FROM building b
+        LEFT JOIN estate_type et ON et.id = b.estate_type_id
+        LEFT JOIN offer o ON o.id = b.offer_id
+        LEFT JOIN city_part cp ON cp.id = b.city_part_id
+        LEFT JOIN city c ON c.id = cp.city_id
+        LEFT JOIN state s ON s.id = c.state_id
+        LEFT JOIN building_floor bf ON bf.building_id = b.id
+        ORDER BY b.id
+    """
+
+    @classmethod
+    def init_app(cls, app):
+        """Pull in export settings."""
+        cfg = app.config
+        cls.DIR        = Path(cfg["EXPORT_DIR"])
+        cls.FORMATS    = cls._parse_formats(cfg["EXPORT_FORMATS"])
+        cls.BATCH_SIZE = cfg["EXPORT_BATCH_SIZE"]
+        cls.KEEP       = cfg["EXPORT_KEEP"]
+        cls.logger = app.logger
+
+        unknown = set(cls.FORMATS) - cls.EXTENSIONS.keys()
+        if unknown:
+            raise RuntimeError(f"Unknown EXPORT_FORMATS: {sorted(unknown)}, "
+                               f"expected {', '.join(cls.EXTENSIONS)}")
+        if not cls.FORMATS:
+            raise RuntimeError(f"EXPORT_FORMATS is empty, expected {', '.join(cls.EXTENSIONS)}")
+
+    @staticmethod
+    def _parse_formats(formats) -> list[str]:
+        """
+        Normalize EXPORT_FORMATS: a comma-separated string or a list, with
+        surrounding whitespace, case and empty items ignored.
+        """
+        if isinstance(formats, str):
+            formats = formats.split(",")
+        return [fmt.strip().lower() for fmt in formats if fmt.strip()]
+
+    @staticmethod
+    def _schema():
+        import pyarrow as pa
+
+        return pa.schema([
+            ("id", pa.int32()),
+            ("square_footage", pa.float64()),
+            ("construction_year", pa.int32()),
+            ("land_area", pa.float64()),
+            ("registration", pa.bool_()),
+            ("rooms", pa.float64()),
+            ("bathrooms", pa.int32()),
+            ("parking", pa.bool_()),
+            ("price", pa.int32()),
+            ("estate_type", pa.string()),
+            ("offer", pa.string()),
+            ("city_part", pa.string()),
+            ("city", pa.string()),
+            ("state", pa.string()),
+            ("floor_level", pa.string()),
+            ("floor_total", pa.int32()),
+            ("amenities", pa.list_(pa.string())),
+            ("heatings", pa.list_(pa.string())),
+            ("import_batch", pa.string()),
+            ("change_seq", pa.int64()),
+            ("updated_at", pa.timestamp("us", tz="UTC")),
+        ])
+
+    @staticmethod
+    def _open_writer(fmt: str, path: Path, schema):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if fmt == "parquet":
+            return pq.ParquetWriter(str(path), schema, compression="zstd")
+        # Uncompressed, so readers can memory-map it without copying
+        return pa.ipc.new_file(str(path), schema)
+
+    @classmethod
+    def export(cls, formats: list[str] | None = None, batch_size: int | None = None) -> dict:
+        """
+        Write one snapshot of all buildings in each of `formats`.
+
+        The whole export reads from a single REPEATABLE READ transaction,
+        so every file is a consistent snapshot.
+
+        Args:
+            formats (list[str] | None): 'parquet' and/or 'arrow', defaults
+                to EXPORT_FORMATS.
+            batch_size (int | None): Rows fetched and written per batch,
+                defaults to EXPORT_BATCH_SIZE.
+
+        Returns:
+            dict: `{"rows": int, "files": {format: Path}}`.
+        """
+        import pyarrow as pa
+
+        formats = formats or cls.FORMATS
+        batch_size = batch_size or cls.BATCH_SIZE
+        schema = cls._schema()
+
+        cls.DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        paths = {fmt: cls.DIR / f"buildings-{stamp}{cls.EXTENSIONS[fmt]}" for fmt in formats}
+        tmp_paths = {fmt: path.with_name(path.name + ".part") for fmt, path in paths.items()}
+
+        writers = {}
+        rows = 0
+        try:
+            with MetricsService.timer("export_seconds"):
+                try:
+                    for fmt, tmp_path in tmp_paths.items():
+                        writers[fmt] = cls._open_writer(fmt, tmp_path, schema)
+
+                    with database.get_engine().connect() as conn:
+                        conn = conn.execution_options(isolation_level="REPEATABLE READ",
+                                                      stream_results=True, yield_per=batch_size)
+                        for partition in conn.execute(text(cls._SNAPSHOT_SQL)).partitions():
+                            columns = list(zip(*partition))
+                            batch = pa.RecordBatch.from_arrays(
+                                [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+                                schema=schema,
+                            )
+                            for writer in writers.values():
+                                writer.write_batch(batch)
+                            rows += batch.num_rows
+                finally:
+                    for writer in writers.values():
+                        writer.close()
+        except Exception:
+            for tmp_path in tmp_paths.values():
+                tmp_path.unlink(missing_ok=True)
+            raise
+
+        for fmt, path in paths.items():
+            os.replace(tmp_paths[fmt], path)
+        MetricsService.inc("export_rows_total", rows)
+        cls._prune()
+        return {"rows": rows, "files": paths}
+
+    @classmethod
+    def _prune(cls) -> None:
+        """Delete all but the newest KEEP snapshots of each format."""
+        for extension in cls.EXTENSIONS.values():
+            snapshots = sorted(cls.DIR.glob(f"buildings-*{extension}"), reverse=True)
+            for old in snapshots[cls.KEEP:]:
+                old.unlink(missing_ok=True)
+
+    @classmethod
+    def snapshots(cls) -> list[Path]:
+        """Completed snapshot files, newest first."""
+        if not cls.DIR.exists():
+            return []
+        files = [p for extension in cls.EXTENSIONS.values() for p in cls.DIR.glob(f"buildings-*{extension}")]
+        return sorted(files, key=lambda p: p.name, reverse=True)
+
+    @classmethod
+    def read_arrow(cls, path: Path | None = None):
+        """
+        Open an Arrow IPC snapshot through a memory map. The returned table
+        references the mapped file directly, so only the pages actually
+        touched are read from disk.
+
+        Args:
+            path (Path | None): Snapshot file, defaults to the newest `.arrow`.
+
+        Returns:
+            pyarrow.Table: The snapshot.
+        """
+        import pyarrow as pa
+
+        if path is None:
+            arrow_files = [p for p in cls.snapshots() if p.suffix == cls.EXTENSIONS["arrow"]]
+            if not arrow_files:
+                raise FileNotFoundError(f"No Arrow snapshot in {cls.DIR}")
+            path = arrow_files[0]
+        with pa.memory_map(str(path), "r") as source:
+            return pa.ipc.open_file(source).read_all()
+
+    @classmethod
+    def run(cls) -> None:
+        """Export a snapshot in every EXPORT_FORMATS format. Scheduled as `export_job`."""
+        result = cls.export()
+        cls.logger.info(f"Exported {result['rows']} buildings to "
+                        f"{', '.join(str(p) for p in result['files'].values())}")
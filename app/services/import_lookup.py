@@ -0,0 +1,111 @@
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import Amenity, City, CityPart, EstateType, Heating, Offer, State
+from app.services.import_validation import flag_rows
+
+
+class ImportLookup:
+    """
+    Name -> id tables for the location and taxonomy columns of an import,
+    loaded once per import and applied to whole columns.
+
+    Names are matched case-insensitively, ignoring surrounding whitespace.
+    City names are unique; city parts are resolved within their city.
+    """
+
+    def __init__(self, db: Session):
+        def names(model) -> dict[str, int]:
+            return {self._key(name): id_ for id_, name in db.execute(select(model.id, model.name))}
+
+        self.estate_types = names(EstateType)
+        self.offers = names(Offer)
+        self.states = names(State)
+        self.cities = names(City)
+        self.amenities = names(Amenity)
+        self.heatings = names(Heating)
+        self.city_states = dict(db.execute(select(City.id, City.state_id)).all())
+
+        city_parts = db.execute(select(CityPart.city_id, CityPart.name, CityPart.id)).all()
+        self.city_parts = pd.DataFrame(city_parts, columns=["city_id", "name", "city_part_id"])
+        self.city_parts["city_id"] = self.city_parts["city_id"].astype("Int64")
+        self.city_parts["name"] = self._normalize(self.city_parts["name"])
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return name.strip().casefold()
+
+    @staticmethod
+    def _normalize(values: pd.Series) -> pd.Series:
+        return values.astype("string").str.strip().str.casefold()
+
+    @classmethod
+    def _map(cls, values: pd.Series, table: dict[str, int]) -> pd.Series:
+        return cls._normalize(values).map(table).astype("Int64")
+
+    def resolve(self, df: pd.DataFrame, errors: pd.Series) -> pd.DataFrame:
+        """
+        Replace name columns by the id columns Building expects.
+
+        Recognized name columns: estate_type, offer, state, city, city_part
+        (needs city), amenities and heatings (lists of names). Unknown names
+        are reported in `errors`.
+
+        Args:
+            df (pd.DataFrame): Frame produced by an import profile.
+            errors (pd.Series): Error text per row (same index), appended to.
+
+        Returns:
+            pd.DataFrame: `df` with `*_id`, `amenity_ids` and `heating_ids`
+                columns; the name columns are dropped.
+        """
+        for column, table in (("estate_type", self.estate_types), ("offer", self.offers)):
+            if column in df:
+                ids = self._map(df[column], table)
+                flag_rows(errors, df[column].notna() & ids.isna(),
+                          f"unknown {column} '" + df[column].astype(str) + "'")
+                df[f"{column}_id"] = ids
+
+        if "city" in df:
+            city_ids = self._map(df["city"], self.cities)
+            flag_rows(errors, df["city"].notna() & city_ids.isna(),
+                      "unknown city '" + df["city"].astype(str) + "'")
+
+            if "state" in df:
+                state_ids = self._map(df["state"], self.states)
+                flag_rows(errors, df["state"].notna() & state_ids.isna(),
+                          "unknown state '" + df["state"].astype(str) + "'")
+                mismatch = state_ids.notna() & city_ids.notna() & (city_ids.map(self.city_states) != state_ids)
+                flag_rows(errors, mismatch, "city is not in state")
+
+            if "city_part" in df:
+                keys = pd.DataFrame({"city_id": city_ids, "name": self._normalize(df["city_part"])})
+                merged = keys.merge(self.city_parts, how="left", on=["city_id", "name"])
+                city_part_ids = pd.Series(merged["city_part_id"].to_numpy(), index=df.index).astype("Int64")
+                flag_rows(errors, df["city_part"].notna() & city_ids.notna() & city_part_ids.isna(),
+                          "unknown city_part '" + df["city_part"].astype(str) + "'")
+                df["city_part_id"] = city_part_ids
+
+        elif "city_part" in df:
+            flag_rows(errors, df["city_part"].notna(), "city_part needs a city")
+
+        for column, target, table in (("amenities", "amenity_ids", self.amenities),
+                                      ("heatings", "heating_ids", self.heatings)):
+            if column in df:
+                names = df[column].explode()
+                keys = self._normalize(names)
+                names, keys = names[keys.notna() & (keys != "")], keys[keys.notna() & (keys != "")]
+                ids = keys.map(table)
+                unknown = names[ids.isna()].astype(str)
+                if not unknown.empty:
+                    messages = unknown.groupby(level=0).agg(", ".join)
+                    bad = pd.Series(False, index=df.index)
+                    bad[messages.index] = True
+                    flag_rows(errors, bad, f"unknown {column} " + messages.reindex(df.index, fill_value=""))
+                found = ids.dropna().astype(int)
+                df[target] = found.groupby(level=0).agg(list).reindex(df.index)
+                df[target] = df[target].apply(lambda v: v if isinstance(v, list) else [])
+
+        return df.drop(columns=[c for c in ("estate_type", "offer", "state", "city", "city_part",
+                                            "amenities", "heatings") if c in df])
@@ -0,0 +1,99 @@
+from abc import ABC, abstractmethod
+
+import pandas as pd
+
+from app.schemas.building import BuildingBase
+from app.services.import_readers import matches_any
+from app.services.import_validation import field_types
+
+
+class ImportProfile(ABC):
+    """
+    Maps one source CSV layout onto the columns CSVService imports.
+
+    `transform` returns a frame with the source index and any of:
+      - BuildingBase fields (price, rooms, square_footage, ...),
+      - ids: estate_type_id, offer_id, city_part_id,
+      - names resolved by ImportLookup: estate_type, offer, state, city,
+        city_part, amenities, heatings (lists of names),
+      - floor_level, floor_total.
+
+    Profiles are listed in IMPORT_PROFILES; a file is imported with the
+    first profile whose `patterns` match its name.
+    """
+
+    name = None
+    patterns = ("*.csv",)
+
+    def __init__(self, config):
+        self.config = config
+
+    def matches(self, name: str) -> bool:
+        """Whether this profile imports the CSV called `name` (case-insensitive)."""
+        return matches_any(name, self.patterns)
+
+    @abstractmethod
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Select the rows to import and map them onto target columns."""
+
+
+class ColumnMapProfile(ImportProfile):
+    """
+    Declarative profile: subclasses only set the class attributes below.
+    """
+
+    query = None            # pandas query selecting the rows to import
+    columns = {}            # target column -> source column
+    scale = {}              # target column -> config key of a unit conversion factor
+    defaults = {}           # target column -> constant, when not mapped
+    list_separator = ";"    # separator of amenity/heating names in one cell
+
+    _INT_FIELDS = {name for name, python_type in field_types(BuildingBase).items() if python_type is int}
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.query:
+            df = df.query(self.query)
+
+        out = pd.DataFrame({target: df[source] for target, source in self.columns.items()},
+                           index=df.index)
+
+        for target, config_key in self.scale.items():
+            numbers = pd.to_numeric(out[target], errors="coerce")
+            scaled = numbers * self.config[config_key]
+            if target in self._INT_FIELDS:
+                scaled = scaled.round()
+            # Keep unparsable values as they are, so validation reports them
+            out[target] = scaled.where(numbers.notna(), out[target])
+
+        for target, value in self.defaults.items():
+            if target not in out:
+                out[target] = value
+
+        for target in ("amenities", "heatings"):
+            if target in out:
+                out[target] = out[target].astype("string").str.split(self.list_separator)
+
+        return out
+
+
+class RealtorProfile(ColumnMapProfile):
+    """
+    realtor.com listings export (USD, acres, sqft). Only `for_sale` rows are
+    imported, all as offer 1; location columns are US-only and not mapped.
+    """
+
+    name = "realtor"
+    query = "status == 'for_sale'"
+    columns = {
+        "price": "price",
+        "rooms": "bed",
+        "bathrooms": "bath",
+        "land_area": "acre_lot",
+        "square_footage": "house_size",
+    }
+    scale = {
+        "price": "NEURO_PER_USD",
+        "land_area": "SQM_PER_ACRE",
+        "square_footage": "SQM_PER_SQFT",
+    }
+    defaults = {"offer_id": 1}
@@ -0,0 +1,75 @@
+import gzip
+import zipfile
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+import pandas as pd
+
+
+@contextmanager
+def _zstd_stream(path: Path) -> Iterator[BinaryIO]:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise RuntimeError(f"Reading {path.name} requires the 'zstandard' package") from e
+    with path.open("rb") as raw, zstandard.ZstdDecompressor().stream_reader(raw) as stream:
+        yield stream
+
+
+def matches_any(name: str, patterns) -> bool:
+    """Whether `name` matches one of the glob `patterns`, ignoring case on every platform."""
+    return any(fnmatchcase(name.lower(), pattern.lower()) for pattern in patterns)
+
+
+def _decompressed_name(path: Path) -> str:
+    """`listings.csv.gz` -> `listings.csv`; a bare `listings.zst` is taken to be a CSV."""
+    return path.stem if Path(path.stem).suffix else f"{path.stem}.csv"
+
+
+def csv_sources(path: Path, chunk_rows: int,
+                mmap_min_bytes: int) -> Iterator[tuple[str, str, Iterator[pd.DataFrame]]]:
+    """
+    Yield every CSV contained in `path` as a stream of DataFrame chunks.
+
+    Compressed files (.gz, .zst) and zip members are decompressed while
+    pandas reads them, so nothing is unpacked to disk. Plain files of at
+    least `mmap_min_bytes` are read through a memory map.
+
+    Each chunk iterator must be consumed before the next item is requested,
+    as advancing closes the previous stream. Chunk indexes continue across
+    chunks, so `index + 2` is the line number in that CSV.
+
+    Args:
+        path (Path): A .csv, .gz, .zst or .zip file.
+        chunk_rows (int): Rows per DataFrame chunk.
+        mmap_min_bytes (int): Size from which plain files are memory-mapped.
+
+    Yields:
+        tuple: `(label, name, chunks)`: a unique label for the CSV (the file
+            name, or `archive.zip/member.csv`), the CSV's own file name
+            (used to pick an import profile) and its chunks.
+    """
+    suffix = path.suffix.lower()
+
+    if suffix == ".zip":
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or not matches_any(info.filename, ("*.csv",)):
+                    continue
+                with archive.open(info) as stream, pd.read_csv(stream, chunksize=chunk_rows) as reader:
+                    yield f"{path.name}/{info.filename}", Path(info.filename).name, reader
+
+    elif suffix == ".gz":
+        with gzip.open(path, "rb") as stream, pd.read_csv(stream, chunksize=chunk_rows) as reader:
+            yield path.name, _decompressed_name(path), reader
+
+    elif suffix == ".zst":
+        with _zstd_stream(path) as stream, pd.read_csv(stream, chunksize=chunk_rows) as reader:
+            yield path.name, _decompressed_name(path), reader
+
+    else:
+        memory_map = path.stat().st_size >= mmap_min_bytes
+        with pd.read_csv(path, chunksize=chunk_rows, memory_map=memory_map) as reader:
+            yield path.name, path.name, reader
@@ -0,0 +1,71 @@
+import itertools
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.schemas import ImportRunOut, ImportStatusOut
+
+
+class ImportStatusService:
+    """
+    Keeps track of running and recently finished CSV imports.
+
+    State is process-local: it reflects the imports executed by the
+    scheduler of the current worker.
+    """
+
+    RECENT_LIMIT = 50
+
+    _lock = threading.Lock()
+    _ids = itertools.count(1)
+    _running: dict[int, ImportRunOut] = {}
+    _recent: deque[ImportRunOut] = deque(maxlen=RECENT_LIMIT)
+
+    @classmethod
+    def start(cls, path: Path) -> ImportRunOut:
+        """Register a new running import for `path`."""
+        run = ImportRunOut(
+            id=next(cls._ids),
+            file=path.name,
+            status="running",
+            started_at=datetime.now(timezone.utc),
+            bytes=path.stat().st_size,
+        )
+        with cls._lock:
+            cls._running[run.id] = run
+        return run
+
+    @classmethod
+    def finish(cls, run: ImportRunOut, error: Exception | None = None) -> None:
+        """Mark `run` as finished and move it to the recent list."""
+        run.finished_at = datetime.now(timezone.utc)
+        run.status = "error" if error is not None else "success"
+        run.error = str(error) if error is not None else None
+        with cls._lock:
+            cls._running.pop(run.id, None)
+            cls._recent.appendleft(run)
+
+    @classmethod
+    def status(cls, data_dir: Path, patterns: list[str] = ("*.csv",)) -> ImportStatusOut:
+        """
+        Build a status report of the import pipeline.
+
+        Args:
+            data_dir (Path): Directory scanned by the importer, used to
+                compute the size of the backlog.
+            patterns (list[str]): File patterns picked up by the importer.
+
+        Returns:
+            ImportStatusOut: Backlog size plus running and recent imports.
+        """
+        backlog = {p for pattern in patterns for p in Path(data_dir).glob(pattern) if p.is_file()}
+        with cls._lock:
+            running = list(cls._running.values())
+            recent = list(cls._recent)
+        return ImportStatusOut(
+            backlog_files=len(backlog),
+            backlog_bytes=sum(p.stat().st_size for p in backlog),
+            running=running,
+            recent=recent,
+        )
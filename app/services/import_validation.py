@@ -0,0 +1,114 @@
+import operator
+import typing
+
+import pandas as pd
+from pydantic import BaseModel
+
+from app.schemas.building import BuildingBase
+
+_BOUNDS = (
+    ("ge", operator.ge, ">="),
+    ("gt", operator.gt, ">"),
+    ("le", operator.le, "<="),
+    ("lt", operator.lt, "<"),
+)
+
+_BOOLEANS = {
+    "true": True, "t": True, "yes": True, "y": True, "da": True, "1": True,
+    "false": False, "f": False, "no": False, "n": False, "ne": False, "0": False,
+}
+
+
+def field_types(model: type[BaseModel]) -> dict[str, type]:
+    """Python type of every field of `model`, with Optional[...] unwrapped."""
+    types = {}
+    for name, field in model.model_fields.items():
+        args = [arg for arg in typing.get_args(field.annotation) if arg is not type(None)]
+        types[name] = args[0] if args else field.annotation
+    return types
+
+
+def flag_rows(errors: pd.Series, mask: pd.Series, message) -> None:
+    """
+    Append `message` (a string or a per-row Series) to the error text of
+    the rows selected by `mask`.
+    """
+    mask = mask.fillna(False).astype(bool)
+    if mask.any():
+        if isinstance(message, pd.Series):
+            message = message[mask]
+        errors[mask] = errors[mask] + message + "; "
+
+
+class FrameValidator:
+    """
+    Applies the field types and numeric bounds declared on a pydantic model
+    (BuildingBase by default) to whole DataFrame columns, instead of
+    validating rows one by one.
+
+    Values that cannot be coerced or break a bound are reported in the
+    `errors` Series and set to NA; the caller decides what to do with the
+    flagged rows.
+    """
+
+    def __init__(self, model: type[BaseModel] = BuildingBase, extra_fields: dict[str, type] | None = None):
+        self.fields: dict[str, tuple[type, list]] = {}
+        for name, python_type in field_types(model).items():
+            bounds = []
+            for meta in model.model_fields[name].metadata:
+                for attr, op, symbol in _BOUNDS:
+                    bound = getattr(meta, attr, None)
+                    if bound is not None:
+                        bounds.append((op, bound, f"{name} must be {symbol} {bound}"))
+            self.fields[name] = (python_type, bounds)
+        for name, python_type in (extra_fields or {}).items():
+            self.fields.setdefault(name, (python_type, []))
+
+    def validate(self, df: pd.DataFrame, errors: pd.Series) -> pd.DataFrame:
+        """
+        Coerce the known columns of `df` to nullable pandas dtypes and
+        check their bounds.
+
+        Args:
+            df (pd.DataFrame): Frame produced by an import profile.
+            errors (pd.Series): Error text per row (same index), appended to.
+
+        Returns:
+            pd.DataFrame: `df` with coerced columns.
+        """
+        for name, (python_type, bounds) in self.fields.items():
+            if name not in df:
+                continue
+            raw = df[name]
+            present = raw.notna()
+            if raw.dtype == object:
+                present &= raw.astype(str).str.strip() != ""
+
+            if python_type is bool:
+                if pd.api.types.is_bool_dtype(raw):
+                    values = raw.astype("boolean")
+                elif pd.api.types.is_numeric_dtype(raw):
+                    values = raw.map({1: True, 0: False}).astype("boolean")
+                else:
+                    values = raw.astype(str).str.strip().str.lower().map(_BOOLEANS).astype("boolean")
+                flag_rows(errors, present & values.isna(), f"{name} is not a boolean")
+
+            elif python_type in (int, float):
+                values = pd.to_numeric(raw, errors="coerce")
+                flag_rows(errors, present & values.isna(), f"{name} is not a number")
+                if python_type is int:
+                    fractional = values.notna() & (values % 1 != 0)
+                    flag_rows(errors, fractional, f"{name} is not an integer")
+                    values = values.where(~fractional).astype("Int64")
+                else:
+                    values = values.astype("Float64")
+                for op, bound, message in bounds:
+                    flag_rows(errors, values.notna() & ~op(values, bound).fillna(True), message)
+
+            else:
+                if pd.api.types.is_float_dtype(raw) and (raw.dropna() % 1 == 0).all():
+                    raw = raw.astype("Int64")   # "3", not "3.0", for numbers read_csv parsed as floats
+                values = raw.where(present).astype("string").str.strip()
+
+            df[name] = values
+        return df
@@ -0,0 +1,115 @@
+import threading
+import time
+from functools import wraps
+
+from flask import abort, g, jsonify, make_response
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app import database
+from app.services.metrics_service import MetricsService
+
+
+class LoadSheddingService:
+    """
+    Pool-aware admission control for low-priority (read) endpoints.
+
+    A read first takes one of READ_CAPACITY (`pool_size + max_overflow -
+    WRITE_RESERVE`) slots, held until the request's session is closed, so
+    concurrent reads can never hold more than their share of the pool.
+    It then waits while the pool as a whole (writes, the import job, the
+    write queue) has fewer than WRITE_RESERVE connections left. A read that
+    is not admitted within MAX_POOL_WAIT seconds is rejected with 503
+    instead of queueing on the pool and delaying everyone else. Writes are
+    never shed and may use the reserve.
+
+    Any request that still times out waiting for a connection (the pool's
+    DB_POOL_TIMEOUT) is answered with the same 503 and Retry-After.
+    """
+
+    ENABLED       = False
+    MAX_POOL_WAIT = None
+    RETRY_AFTER   = None
+    READ_CAPACITY = None
+
+    POLL_INTERVAL = 0.01   # seconds between pool checks while a read waits
+
+    _read_slots = None
+
+    @classmethod
+    def init_app(cls, app):
+        """Derive the read capacity from the pool configuration and map pool timeouts to 503."""
+        cfg = app.config
+        cls.ENABLED       = cfg["LOAD_SHED_ENABLED"]
+        cls.MAX_POOL_WAIT = cfg["LOAD_SHED_MAX_POOL_WAIT"]
+        cls.RETRY_AFTER   = cfg["LOAD_SHED_RETRY_AFTER"]
+
+        pool_capacity = int(cfg.get("DB_POOL_SIZE", 5)) + int(cfg.get("DB_MAX_OVERFLOW", 10))
+        cls.READ_CAPACITY = max(pool_capacity - cfg["LOAD_SHED_WRITE_RESERVE"], 1)
+        cls._read_slots   = threading.BoundedSemaphore(cls.READ_CAPACITY)
+
+        app.register_error_handler(PoolTimeoutError, cls._pool_timeout)
+        app.teardown_appcontext(cls._release)
+        app.logger.info(f"Load shedding: at most {cls.READ_CAPACITY}/{pool_capacity} "
+                        f"connections used by reads")
+
+    @classmethod
+    def _overloaded(cls, message: str):
+        payload = {
+            "error": "Service overloaded",
+            "message": message,
+        }
+        response = make_response(jsonify(payload), 503)
+        response.headers["Retry-After"] = str(cls.RETRY_AFTER)
+        return response
+
+    @classmethod
+    def _pool_timeout(cls, e):
+        MetricsService.inc("pool_timeouts_total")
+        return cls._overloaded("No database connection available, retry later")
+
+    @classmethod
+    def _pool_busy(cls) -> bool:
+        """Whether reads have used up their share of the pool (pools without a count never are)."""
+        checkedout = getattr(database.get_engine().pool, "checkedout", None)
+        return checkedout is not None and checkedout() >= cls.READ_CAPACITY
+
+    @classmethod
+    def _release(cls, e=None):
+        """Free the request's read slot once its connection is back in the pool."""
+        if g.pop("read_slot", False):
+            # Teardown functions run in reverse registration order, so close
+            # the session here rather than rely on database.close_db first.
+            database.close_db(e)
+            cls._read_slots.release()
+
+    @classmethod
+    def _shed_request(cls):
+        MetricsService.inc("requests_shed_total")
+        abort(cls._overloaded("Too many concurrent reads, retry later"))
+
+    @classmethod
+    def shed(cls, view):
+        """
+        Decorator marking a view as low priority.
+
+        The view runs once it holds a read slot and the pool has room for
+        reads; until then the request waits for at most MAX_POOL_WAIT
+        seconds. The slot is released when the request is torn down, so
+        streamed responses keep it until the stream ends.
+
+        Raises:
+            503: With a Retry-After header when the pool stays busy.
+        """
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if cls.ENABLED and not g.get("read_slot", False):
+                deadline = time.monotonic() + cls.MAX_POOL_WAIT
+                if not cls._read_slots.acquire(timeout=cls.MAX_POOL_WAIT):
+                    cls._shed_request()
+                g.read_slot = True
+                while cls._pool_busy():
+                    if time.monotonic() >= deadline:
+                        cls._shed_request()
+                    time.sleep(cls.POLL_INTERVAL)
+            return view(*args, **kwargs)
+        return wrapper
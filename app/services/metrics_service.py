@@ -0,0 +1,107 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from flask import g, request
+
+
+class MetricsService:
+    """
+    In-process registry of counters, gauges and timers.
+
+    Shared by the HTTP layer and the CSV import pipeline so that everything
+    is exposed on a single metrics endpoint. Metric series are identified by
+    a name plus an optional set of string labels.
+    """
+
+    _lock = threading.Lock()
+    _counters: dict[tuple, float] = {}
+    _gauges: dict[tuple, float] = {}
+    _timers: dict[tuple, list[float]] = {}
+
+    @classmethod
+    def init_app(cls, app):
+        """Record per-endpoint request counts and latencies."""
+
+        @app.before_request
+        def _start_request_timer():
+            g.metrics_started_at = time.perf_counter()
+
+        @app.after_request
+        def _record_request(response):
+            started_at = g.pop("metrics_started_at", None)
+            if started_at is not None:
+                endpoint = request.endpoint or "unknown"
+                cls.observe("http_request_seconds", time.perf_counter() - started_at,
+                            endpoint=endpoint, method=request.method)
+                cls.inc("http_requests_total", endpoint=endpoint,
+                        method=request.method, status=str(response.status_code))
+            return response
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> tuple:
+        return name, tuple(sorted(labels.items()))
+
+    @classmethod
+    def inc(cls, name: str, value: float = 1, **labels) -> None:
+        """Increase a counter by `value`."""
+        key = cls._key(name, labels)
+        with cls._lock:
+            cls._counters[key] = cls._counters.get(key, 0) + value
+
+    @classmethod
+    def set_gauge(cls, name: str, value: float, **labels) -> None:
+        """Set a gauge to an absolute value."""
+        with cls._lock:
+            cls._gauges[cls._key(name, labels)] = value
+
+    @classmethod
+    def observe(cls, name: str, seconds: float, **labels) -> None:
+        """Record a single duration for a timer (count, total, max)."""
+        key = cls._key(name, labels)
+        with cls._lock:
+            stats = cls._timers.setdefault(key, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    @classmethod
+    @contextmanager
+    def timer(cls, name: str, **labels) -> Iterator[None]:
+        """Time the wrapped block and record it under `name`."""
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.observe(name, time.perf_counter() - started_at, **labels)
+
+    @classmethod
+    def snapshot(cls) -> dict:
+        """
+        Return a JSON-serializable copy of every metric series.
+
+        Returns:
+            dict: `counters`, `gauges` and `timers`, each a list of series.
+        """
+        with cls._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in cls._counters.items()
+            ]
+            gauges = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in cls._gauges.items()
+            ]
+            timers = [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": count,
+                    "total_seconds": total,
+                    "max_seconds": maximum,
+                    "avg_seconds": total / count if count else 0.0,
+                }
+                for (name, labels), (count, total, maximum) in cls._timers.items()
+            ]
+        return {"counters": counters, "gauges": gauges, "timers": timers}
@@ -0,0 +1,125 @@
+import math
+from abc import ABC, abstractmethod
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import abort, jsonify, make_response, request
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from werkzeug.utils import import_string
+
+from app.services.metrics_service import MetricsService
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage for token buckets. Subclass and point RATELIMIT_BACKEND at the
+    subclass to share buckets between workers (e.g. Redis).
+    """
+
+    @abstractmethod
+    def consume(self, key: str, rate: float, burst: int, cost: float = 1) -> float:
+        """
+        Take `cost` tokens from the bucket identified by `key`.
+
+        Args:
+            key (str): Bucket identifier (scope + client).
+            rate (float): Refill rate in tokens per second.
+            burst (int): Bucket capacity.
+            cost (float): Tokens needed by this request.
+
+        Returns:
+            float: 0 if the request is allowed, otherwise seconds until
+                enough tokens are available.
+        """
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Process-local token buckets, bounded to `max_keys` most recent clients.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def consume(self, key: str, rate: float, burst: int, cost: float = 1) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated_at) * rate)
+
+            if tokens >= cost:
+                tokens -= cost
+                retry_after = 0.0
+            else:
+                retry_after = (cost - tokens) / rate
+
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+
+class RateLimitService:
+    """
+    Token-bucket rate limiting per client and scope.
+
+    Clients are identified by their JWT identity when a valid token is
+    sent, and by their remote address otherwise.
+    """
+
+    ENABLED = False
+    RULES   = {}
+    backend: RateLimitBackend = None
+
+    @classmethod
+    def init_app(cls, app):
+        """Pull in rate limit settings and instantiate the backend."""
+        cfg = app.config
+        cls.ENABLED = cfg["RATELIMIT_ENABLED"]
+        cls.RULES   = cfg["RATELIMIT_RULES"]
+        cls.backend = import_string(cfg["RATELIMIT_BACKEND"])()
+
+    @staticmethod
+    def _client_key() -> str:
+        try:
+            verify_jwt_in_request(optional=True)
+            identity = get_jwt_identity()
+        except Exception:
+            identity = None
+        if identity is not None:
+            return f"user:{identity}"
+        return f"ip:{request.remote_addr}"
+
+    @classmethod
+    def limit(cls, scope: str):
+        """
+        Decorator enforcing the RATELIMIT_RULES entry for `scope`.
+
+        Raises:
+            429: With a Retry-After header when the client's bucket is empty.
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                rule = cls.RULES.get(scope)
+                if cls.ENABLED and rule is not None:
+                    retry_after = cls.backend.consume(
+                        f"{scope}:{cls._client_key()}", rule["rate"], rule["burst"]
+                    )
+                    if retry_after > 0:
+                        MetricsService.inc("rate_limited_total", scope=scope)
+                        payload = {
+                            "error": "Too many requests",
+                            "message": f"Rate limit for '{scope}' exceeded, retry later",
+                        }
+                        response = make_response(jsonify(payload), 429)
+                        response.headers["Retry-After"] = str(max(math.ceil(retry_after), 1))
+                        abort(response)
+                return view(*args, **kwargs)
+            return wrapper
+        return decorator
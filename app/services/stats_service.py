@@ -0,0 +1,209 @@
+import math
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models import BuildingStats, City, CityPart, EstateType, Offer, State
+from app.schemas import MetricStatsOut, StatsGroupOut, StatsOut, StatsQuery
+
+
+class StatsService:
+    """
+    Maintains the `building_stats` rollup and answers statistics queries
+    from it.
+
+    Writers describe each affected building by its contribution, a
+    `(city_part_id, estate_type_id, offer_id, price, square_footage,
+    land_area)` tuple, and call `apply` with the added and removed
+    contributions in the same transaction as the write. Updates remove the
+    old contribution and add the new one; nothing is ever recomputed from
+    the building table.
+    """
+
+    METRICS = ("price", "square_footage", "land_area", "price_per_sqm")
+    # Name column used to filter and label each `StatsQuery` dimension
+    DIMENSIONS = {
+        "state": State.name,
+        "city": City.name,
+        "estate_type": EstateType.name,
+        "offer": Offer.name,
+    }
+
+    # Bootstrap / repair only (`flask stats rebuild`), never on the write path.
+    REBUILD_SQL = """
+        DELETE FROM building_stats;
+        INSERT INTO building_stats (
+            state_id, city_id, estate_type_id, offer_id, count,
+            price_n, price_sum, price_sumsq,
+            square_footage_n, square_footage_sum, square_footage_sumsq,
+            land_area_n, land_area_sum, land_area_sumsq,
+            price_per_sqm_n, price_per_sqm_sum, price_per_sqm_sumsq
+        )
+        SELECT c.state_id, cp.city_id, s.estate_type_id, s.offer_id, count(*),
+               count(s.price), coalesce(sum(s.price), 0), coalesce(sum(s.price ^ 2), 0),
+               count(s.square_footage), coalesce(sum(s.square_footage), 0),
+               coalesce(sum(s.square_footage ^ 2), 0),
+               count(s.land_area), coalesce(sum(s.land_area), 0), coalesce(sum(s.land_area ^ 2), 0),
+               count(s.ppsqm), coalesce(sum(s.ppsqm), 0), coalesce(sum(s.ppsqm ^ 2), 0)
+        FROM (
+            SELECT b.city_part_id, b.estate_type_id, b.offer_id,
+                   b.price::double precision AS price, b.square_footage, b.land_area,
+                   b.price / nullif(b.square_footage, 0) AS ppsqm
+            FROM building b
+        ) s
+        LEFT JOIN city_part cp ON cp.id = s.city_part_id
+        LEFT JOIN city c ON c.id = cp.city_id
+        GROUP BY 1, 2, 3, 4;
+    """
+
+    # Building columns a contribution is made of, in tuple order
+    COLUMNS = ("city_part_id", "estate_type_id", "offer_id", "price", "square_footage", "land_area")
+
+    @classmethod
+    def contribution(cls, building) -> tuple:
+        """Contribution tuple of a Building (or any row with the same attributes)."""
+        return tuple(getattr(building, column) for column in cls.COLUMNS)
+
+    @staticmethod
+    def _lock_order(key: tuple) -> tuple:
+        """Sort key for group keys that may contain NULLs (sorted last)."""
+        return tuple((value is None, value or 0) for value in key)
+
+    @classmethod
+    def apply(cls, db: Session, added: Iterable[tuple] = (), removed: Iterable[tuple] = ()) -> None:
+        """
+        Add and subtract building contributions from the rollup with one
+        upsert. Must run in the transaction of the write it describes, which
+        keeps the touched group rows locked until it commits, and after the
+        building rows have been written (and so locked).
+
+        Args:
+            db (Session): Active SQLAlchemy session; the caller commits.
+            added (Iterable[tuple]): Contributions of inserted/new rows.
+            removed (Iterable[tuple]): Contributions of deleted/old rows.
+        """
+        deltas: dict[tuple, list[float]] = defaultdict(lambda: [0] * (1 + 3 * len(cls.METRICS)))
+        for sign, contributions in ((1, added), (-1, removed)):
+            for city_part_id, estate_type_id, offer_id, price, sqft, land_area in contributions:
+                price_per_sqm = price / sqft if price is not None and sqft else None
+                delta = deltas[(city_part_id, estate_type_id, offer_id)]
+                delta[0] += sign
+                for i, value in enumerate((price, sqft, land_area, price_per_sqm)):
+                    if value is not None:
+                        delta[1 + 3 * i] += sign
+                        delta[2 + 3 * i] += sign * value
+                        delta[3 + 3 * i] += sign * value * value
+
+        if not deltas:
+            return
+
+        city_part_ids = {key[0] for key in deltas if key[0] is not None}
+        locations = {}
+        if city_part_ids:
+            locations = {
+                row.id: (row.state_id, row.city_id)
+                for row in db.execute(
+                    select(CityPart.id, CityPart.city_id, City.state_id)
+                    .join(City, City.id == CityPart.city_id, isouter=True)
+                    .where(CityPart.id.in_(city_part_ids))
+                )
+            }
+
+        grouped: dict[tuple, list[float]] = defaultdict(lambda: [0] * (1 + 3 * len(cls.METRICS)))
+        for (city_part_id, estate_type_id, offer_id), delta in deltas.items():
+            state_id, city_id = locations.get(city_part_id, (None, None))
+            group = grouped[(state_id, city_id, estate_type_id, offer_id)]
+            for i, value in enumerate(delta):
+                group[i] += value
+
+        columns = ["count"] + [f"{metric}_{part}" for metric in cls.METRICS for part in ("n", "sum", "sumsq")]
+        # Upsert in group key order. Writers lock their building rows first
+        # and then the shared group rows, always in the same order, so they
+        # do not deadlock each other on the rollup. This relies on callers
+        # writing the buildings before calling apply.
+        rows = [
+            {"state_id": key[0], "city_id": key[1], "estate_type_id": key[2], "offer_id": key[3],
+             **dict(zip(columns, values))}
+            for key, values in sorted(grouped.items(), key=lambda item: cls._lock_order(item[0]))
+            if any(values)
+        ]
+        if not rows:
+            return
+
+        stmt = insert(BuildingStats).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="building_stats_group_key",
+            set_={column: getattr(BuildingStats, column) + getattr(stmt.excluded, column)
+                  for column in columns},
+        )
+        db.execute(stmt)
+
+    @classmethod
+    def rebuild(cls, db: Session) -> None:
+        """Recompute the whole rollup from the building table."""
+        db.execute(text(cls.REBUILD_SQL))
+
+    @staticmethod
+    def _metric(n: int, total: float, sumsq: float) -> MetricStatsOut:
+        if not n:
+            return MetricStatsOut(n=0, mean=None, stddev=None)
+        mean = total / n
+        variance = (sumsq - total * total / n) / (n - 1) if n > 1 else 0.0
+        return MetricStatsOut(n=n, mean=mean, stddev=math.sqrt(max(variance, 0.0)))
+
+    @classmethod
+    def query(cls, db: Session, filters: StatsQuery) -> StatsOut:
+        """
+        Aggregate the rollup rows matching `filters`, optionally grouped.
+
+        The cost depends on the number of rollup groups, not on the
+        number of buildings.
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            filters (StatsQuery): Name filters and `group_by` dimensions.
+
+        Returns:
+            StatsOut: One entry per group (a single entry when ungrouped).
+        """
+        sums = [func.coalesce(func.sum(BuildingStats.count), 0).label("count")]
+        for metric in cls.METRICS:
+            for part in ("n", "sum", "sumsq"):
+                column = getattr(BuildingStats, f"{metric}_{part}")
+                sums.append(func.coalesce(func.sum(column), 0).label(f"{metric}_{part}"))
+
+        group_labels = [cls.DIMENSIONS[name].label(name) for name in filters.group_by]
+        stmt = (
+            select(*group_labels, *sums)
+            .select_from(BuildingStats)
+            .join(State, State.id == BuildingStats.state_id, isouter=True)
+            .join(City, City.id == BuildingStats.city_id, isouter=True)
+            .join(EstateType, EstateType.id == BuildingStats.estate_type_id, isouter=True)
+            .join(Offer, Offer.id == BuildingStats.offer_id, isouter=True)
+        )
+        for name in cls.DIMENSIONS:
+            value: Optional[str] = getattr(filters, name)
+            if value is not None:
+                stmt = stmt.where(cls.DIMENSIONS[name] == value)
+        if group_labels:
+            # Groups whose listings were all removed keep a row of zeros
+            stmt = (
+                stmt.group_by(*group_labels)
+                .having(func.sum(BuildingStats.count) > 0)
+                .order_by(*group_labels)
+            )
+
+        groups = []
+        for row in db.execute(stmt):
+            values = row._mapping
+            groups.append(StatsGroupOut(
+                **{name: values[name] for name in filters.group_by},
+                count=values["count"],
+                **{metric: cls._metric(values[f"{metric}_n"], values[f"{metric}_sum"],
+                                       values[f"{metric}_sumsq"])
+                   for metric in cls.METRICS},
+            ))
+        return StatsOut(groups=groups)
@@ -0,0 +1,94 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from flask_jwt_extended import JWTManager
+
+from app.services.metrics_service import MetricsService
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of already verified JWT claims.
+
+    Entries are keyed by the SHA-256 digest of the encoded token, so raw
+    tokens are never kept in memory, and each entry expires together with
+    its token (`exp` claim).
+    """
+
+    def __init__(self, maxsize: int = 10_000, default_ttl: float = 3600):
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+
+    @staticmethod
+    def _key(encoded_token: str) -> bytes:
+        return hashlib.sha256(encoded_token.encode()).digest()
+
+    def get(self, encoded_token: str) -> dict | None:
+        """Return the cached claims, or None when missing or expired."""
+        key = self._key(encoded_token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def put(self, encoded_token: str, claims: dict) -> None:
+        """Store verified `claims` until the token expires."""
+        expires_at = claims.get("exp") or time.time() + self.default_ttl
+        with self._lock:
+            self._entries[self._key(encoded_token)] = (expires_at, claims)
+            self._entries.move_to_end(self._key(encoded_token))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CachingJWTManager(JWTManager):
+    """
+    JWTManager that skips signature verification for tokens it already
+    verified, until they expire.
+
+    Only plain header tokens are cached: CSRF-protected and expired-token
+    decodes always go through full verification.
+    """
+
+    def __init__(self, app=None, add_context_processor: bool = False):
+        self.token_cache = VerifiedTokenCache()
+        super().__init__(app, add_context_processor)
+
+    def init_app(self, app, add_context_processor: bool = False) -> None:
+        super().init_app(app, add_context_processor)
+        self.token_cache = VerifiedTokenCache(
+            maxsize=app.config["JWT_VERIFY_CACHE_SIZE"],
+            default_ttl=app.config["JWT_VERIFY_CACHE_TTL"],
+        )
+
+    def _decode_jwt_from_config(self, encoded_token: str, csrf_value=None,
+                                allow_expired: bool = False) -> dict:
+        if csrf_value is not None or allow_expired:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        claims = self.token_cache.get(encoded_token)
+        if claims is not None:
+            MetricsService.inc("jwt_verify_cache_total", result="hit")
+            return dict(claims)
+
+        MetricsService.inc("jwt_verify_cache_total", result="miss")
+        claims = super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+        self.token_cache.put(encoded_token, claims)
+        return dict(claims)
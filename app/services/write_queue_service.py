@@ -0,0 +1,283 @@
+import json
+import os
+import socket
+import sqlite3
+import uuid
+from collections import OrderedDict
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import select
+from werkzeug.exceptions import HTTPException
+
+from app import database
+from app.models import Amenity, Building, Heating
+from app.schemas import BuildingIn, BuildingPatch
+from app.services.building_service import BuildingService
+from app.services.metrics_service import MetricsService
+
+
+class WriteQueueService:
+    """
+    Durable write-behind queue for building mutations.
+
+    Accepted payloads are stored in a local SQLite file and applied later by
+    the `write_queue_job` scheduler job:
+      - queued creates are inserted together with one bulk write,
+      - queued patches for the same building are merged into one patch.
+    Each job keeps its own status (queued, running, done, error).
+
+    The queue file may be shared by several processes. A claimed job holds
+    a lease (claimed_by, claimed_at) and is only claimed again once the
+    lease is older than LEASE_SECONDS, i.e. when its worker died or hung;
+    the lease must therefore be longer than processing one batch takes.
+    """
+
+    ENABLED       = False
+    PATH          = None
+    BATCH_SIZE    = None
+    LEASE_SECONDS = None
+
+    app = None
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS write_job (
+            id          TEXT PRIMARY KEY,
+            op          TEXT NOT NULL,
+            building_id INTEGER,
+            payload     TEXT NOT NULL,
+            status      TEXT NOT NULL,
+            result_id   INTEGER,
+            error       TEXT,
+            claimed_by  TEXT,
+            claimed_at  TEXT,
+            created_at  TEXT NOT NULL,
+            updated_at  TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS write_job_status_idx ON write_job (status, created_at);
+    """
+
+    @classmethod
+    def init_app(cls, app):
+        """Pull in queue settings and create the queue file if needed."""
+        cfg = app.config
+        cls.ENABLED    = cfg["WRITE_QUEUE_ENABLED"]
+        cls.PATH       = Path(cfg["WRITE_QUEUE_PATH"])
+        cls.BATCH_SIZE = cfg["WRITE_QUEUE_BATCH_SIZE"]
+        cls.LEASE_SECONDS = cfg["WRITE_QUEUE_LEASE_SECONDS"]
+        cls.app = app
+
+        if not cls.ENABLED:
+            return
+
+        cls.PATH.parent.mkdir(parents=True, exist_ok=True)
+        with closing(cls._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(cls._SCHEMA)
+            # Queue files created before jobs had leases
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(write_job)")}
+            for column in ("claimed_by", "claimed_at"):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE write_job ADD COLUMN {column} TEXT")
+
+    @classmethod
+    def _connect(cls) -> sqlite3.Connection:
+        conn = sqlite3.connect(cls.PATH, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+    @staticmethod
+    def _worker_id() -> str:
+        # Evaluated per call, so forked workers do not share the parent's id
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    @classmethod
+    def enqueue(cls, op: str, payload: dict, building_id: int | None = None) -> str:
+        """
+        Store a mutation for asynchronous processing.
+
+        Args:
+            op (str): 'create' or 'patch'.
+            payload (dict): Dumped BuildingIn / BuildingPatch.
+            building_id (int | None): Target building for patches.
+
+        Returns:
+            str: The job id.
+        """
+        job_id = uuid.uuid4().hex
+        now = cls._now()
+        with closing(cls._connect()) as conn:
+            conn.execute(
+                "INSERT INTO write_job (id, op, building_id, payload, status, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, 'queued', ?, ?)",
+                (job_id, op, building_id, json.dumps(payload), now, now),
+            )
+        MetricsService.inc("write_queue_enqueued_total", op=op)
+        return job_id
+
+    @classmethod
+    def get(cls, job_id: str) -> dict | None:
+        """Return the job row as a dict, or None if unknown."""
+        with closing(cls._connect()) as conn:
+            row = conn.execute(
+                "SELECT id, op, building_id, status, result_id, error, created_at, updated_at"
+                " FROM write_job WHERE id = ?", (job_id,)
+            ).fetchone()
+        return dict(row) if row is not None else None
+
+    @classmethod
+    def _claim(cls) -> list[sqlite3.Row]:
+        """
+        Lease up to BATCH_SIZE jobs to this process: queued jobs, and
+        running jobs whose lease has expired (or that predate leases).
+        """
+        now = datetime.now(timezone.utc)
+        expired = (now - timedelta(seconds=cls.LEASE_SECONDS)).isoformat()
+        with closing(cls._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT * FROM write_job"
+                " WHERE status = 'queued'"
+                "    OR (status = 'running' AND (claimed_at IS NULL OR claimed_at < ?))"
+                " ORDER BY created_at LIMIT ?",
+                (expired, cls.BATCH_SIZE),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE write_job SET status = 'running', claimed_by = ?, claimed_at = ?, updated_at = ?"
+                " WHERE id = ?",
+                [(cls._worker_id(), now.isoformat(), now.isoformat(), row["id"]) for row in rows],
+            )
+            conn.execute("COMMIT")
+
+        reclaimed = sum(row["status"] == "running" for row in rows)
+        if reclaimed:
+            MetricsService.inc("write_queue_reclaimed_total", reclaimed)
+        return rows
+
+    @classmethod
+    def _finish(cls, results: list[tuple[str, int | None, str | None]]) -> None:
+        """Record job results, unless another process has taken over the lease."""
+        now = cls._now()
+        worker_id = cls._worker_id()
+        with closing(cls._connect()) as conn, conn:
+            conn.executemany(
+                "UPDATE write_job SET status = ?, result_id = ?, error = ?, updated_at = ?"
+                " WHERE id = ? AND claimed_by = ?",
+                [("error" if error else "done", result_id, error, now, job_id, worker_id)
+                 for job_id, result_id, error in results],
+            )
+        for _, _, error in results:
+            MetricsService.inc("write_queue_processed_total", status="error" if error else "done")
+
+    @classmethod
+    def process_queue(cls) -> None:
+        """Drain the queue in batches. Scheduled as `write_queue_job`."""
+        if not cls.ENABLED:
+            return
+        with cls.app.app_context():
+            while rows := cls._claim():
+                creates = [row for row in rows if row["op"] == "create"]
+                patches = [row for row in rows if row["op"] == "patch"]
+                with MetricsService.timer("write_queue_batch_seconds"):
+                    for process, group in ((cls._process_creates, creates), (cls._process_patches, patches)):
+                        if not group:
+                            continue
+                        try:
+                            results = process(group)
+                        except Exception as e:
+                            # Never leave claimed jobs running until their lease expires
+                            cls.app.logger.exception("Write queue batch failed")
+                            results = [(row["id"], None, cls._error_message(e)) for row in group]
+                        cls._finish(results)
+
+    @staticmethod
+    def _error_message(e: Exception) -> str:
+        if isinstance(e, HTTPException) and e.response is not None:
+            return e.response.get_data(as_text=True).strip()
+        return str(e)
+
+    @classmethod
+    def _process_creates(cls, rows: list[sqlite3.Row]) -> list[tuple]:
+        """
+        Insert all queued creates with one bulk write. Payloads that no
+        longer validate fail on their own. If the batch fails (e.g. one
+        payload has a bad foreign key), fall back to creating the jobs one
+        by one so the error is attributed to the right job.
+        """
+        invalid, valid_rows, payloads = [], [], []
+        for row in rows:
+            try:
+                payloads.append(BuildingIn.model_validate_json(row["payload"]))
+                valid_rows.append(row)
+            except ValueError as e:     # pydantic.ValidationError
+                invalid.append((row["id"], None, cls._error_message(e)))
+        rows = valid_rows
+        results = list(invalid)
+        if not rows:
+            return results
+
+        try:
+            with database.transactional_session() as db:
+                amenities = {a.id: a for a in db.scalars(select(Amenity).where(
+                    Amenity.id.in_({i for p in payloads for i in p.amenity_ids or []})))}
+                heatings = {h.id: h for h in db.scalars(select(Heating).where(
+                    Heating.id.in_({i for p in payloads for i in p.heating_ids or []})))}
+
+                buildings = []
+                for row, building_in in zip(rows, payloads):
+                    missing_amenities = set(building_in.amenity_ids or []) - amenities.keys()
+                    missing_heatings = set(building_in.heating_ids or []) - heatings.keys()
+                    if missing_amenities or missing_heatings:
+                        errors = [f"{label} ID(s) not found: {sorted(missing)}"
+                                  for label, missing in (("Amenity", missing_amenities),
+                                                         ("Heating", missing_heatings)) if missing]
+                        results.append((row["id"], None, "; ".join(errors)))
+                        continue
+                    building_orm = Building(**building_in.model_dump(exclude={"amenity_ids", "heating_ids"}))
+                    building_orm.amenities = [amenities[i] for i in building_in.amenity_ids or []]
+                    building_orm.heatings = [heatings[i] for i in building_in.heating_ids or []]
+                    buildings.append((row["id"], building_orm))
+
+                BuildingService.bulk_create(db=db, buildings_orm=[b for _, b in buildings])
+                results.extend((job_id, building_orm.id, None) for job_id, building_orm in buildings)
+            return results
+
+        except Exception:
+            results = list(invalid)
+            for row, building_in in zip(rows, payloads):
+                with database.SessionLocal() as db:
+                    try:
+                        building_out = BuildingService.create(db=db, building_in=building_in)
+                        results.append((row["id"], building_out.id, None))
+                    except Exception as e:
+                        results.append((row["id"], None, cls._error_message(e)))
+            return results
+
+    @classmethod
+    def _process_patches(cls, rows: list[sqlite3.Row]) -> list[tuple]:
+        """
+        Merge queued patches per building (later fields win) and apply each
+        merged patch once.
+        """
+        merged: OrderedDict[int, tuple[list[str], dict]] = OrderedDict()
+        for row in rows:
+            job_ids, payload = merged.setdefault(row["building_id"], ([], {}))
+            job_ids.append(row["id"])
+            payload.update(json.loads(row["payload"]))
+
+        results = []
+        for building_id, (job_ids, payload) in merged.items():
+            with database.SessionLocal() as db:
+                try:
+                    BuildingService.patch(db=db, building_id=building_id,
+                                          building_patch=BuildingPatch.model_validate(payload))
+                    error = None
+                except Exception as e:
+                    error = cls._error_message(e)
+            results.extend((job_id, None if error else building_id, error) for job_id in job_ids)
+        return results
@@ -0,0 +1,33 @@
+"""
+Benchmarks for the per-request cost of JWT authentication on write endpoints.
+"""
+import pytest
+from flask_jwt_extended import create_access_token, verify_jwt_in_request
+
+from app import jwt
+
+
+@pytest.fixture
+def auth_headers(app):
+    with app.app_context():
+        token = create_access_token(identity="bench")
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.benchmark(group="jwt-verify")
+def test_verify_uncached(benchmark, app, auth_headers):
+    def run():
+        jwt.token_cache.clear()
+        with app.test_request_context(headers=auth_headers):
+            verify_jwt_in_request()
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="jwt-verify")
+def test_verify_cached(benchmark, app, auth_headers):
+    def run():
+        with app.test_request_context(headers=auth_headers):
+            verify_jwt_in_request()
+
+    benchmark(run)
@@ -0,0 +1,95 @@
+"""
+Benchmarks for the `BuildingService` hot paths.
+"""
+import itertools
+
+import pytest
+
+from app.schemas import BuildingIn, BuildingPatch, BuildingSearchQuery
+from app.services import BuildingService
+
+FILTER_VALUES = {
+    "min_sqft": 50,
+    "max_sqft": 200,
+    "parking": True,
+    "state": "Srbija",
+    "estate_type": "stan",
+}
+
+FILTER_COMBINATIONS = [
+    combination
+    for n in range(len(FILTER_VALUES) + 1)
+    for combination in itertools.combinations(FILTER_VALUES, n)
+]
+
+
+def _query(**kwargs) -> BuildingSearchQuery:
+    return BuildingSearchQuery.model_validate(kwargs)
+
+
+@pytest.mark.benchmark(group="search-filters")
+@pytest.mark.parametrize("filters", FILTER_COMBINATIONS, ids=lambda c: "+".join(c) or "none")
+def test_search_filters(benchmark, db, filters):
+    query = _query(**{name: FILTER_VALUES[name] for name in filters})
+
+    def run():
+        db.expunge_all()
+        return BuildingService.search(db=db, filters=query)
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="search-pages")
+@pytest.mark.parametrize("page", [1, 10, 100, 1000, 10_000])
+def test_search_deep_pages(benchmark, db, page):
+    query = _query(page=page, size=100)
+
+    def run():
+        db.expunge_all()
+        return BuildingService.search(db=db, filters=query)
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="get-by-id")
+def test_get_by_id(benchmark, db, building_ids):
+    ids = itertools.cycle(building_ids)
+
+    def run():
+        db.expunge_all()
+        return BuildingService.get_by_id(db=db, building_id=next(ids))
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="write")
+def test_create(benchmark, db):
+    building_in = BuildingIn(
+        square_footage=85.0, rooms=3.0, bathrooms=1, price=120_000, parking=True,
+        estate_type_id=2, offer_id=1, amenity_ids=[1, 8], heating_ids=[1],
+    )
+    benchmark(BuildingService.create, db=db, building_in=building_in)
+
+
+@pytest.mark.benchmark(group="write")
+def test_update(benchmark, db, building_ids):
+    ids = itertools.cycle(building_ids)
+    prices = itertools.count(100_000)
+
+    def run():
+        building_in = BuildingIn(price=next(prices), amenity_ids=[1, 2], heating_ids=[3])
+        return BuildingService.update(db=db, building_id=next(ids), building_in=building_in)
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="write")
+def test_patch(benchmark, db, building_ids):
+    ids = itertools.cycle(building_ids)
+    prices = itertools.count(100_000)
+
+    def run():
+        building_patch = BuildingPatch(price=next(prices), amenity_ids=[1, 2], heating_ids=[3])
+        return BuildingService.patch(db=db, building_id=next(ids), building_patch=building_patch)
+
+    benchmark(run)
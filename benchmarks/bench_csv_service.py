@@ -0,0 +1,34 @@
+"""
+Benchmarks for the CSV import pipeline on large files.
+"""
+import os
+from contextlib import contextmanager
+
+import pytest
+
+from app.services import CSVService
+from app.services import csv_service
+from benchmarks.datagen import write_realtor_csv
+
+CSV_ROWS = [int(n) for n in os.getenv("BENCH_CSV_ROWS", "100000,1000000").split(",")]
+
+
+@pytest.fixture(scope="session", params=CSV_ROWS, ids=lambda n: f"{n}-rows")
+def realtor_csv(request, tmp_path_factory):
+    return write_realtor_csv(tmp_path_factory.mktemp("csv") / "realtor.csv", request.param)
+
+
+@pytest.mark.benchmark(group="csv-import")
+def test_process_file(benchmark, db, monkeypatch, realtor_csv):
+    @contextmanager
+    def savepoint_session():
+        # Write into the benchmark's rolled-back transaction instead of committing.
+        yield db
+        db.flush()
+        db.expunge_all()
+
+    monkeypatch.setattr(csv_service, "transactional_session", savepoint_session)
+
+    destination = benchmark.pedantic(CSVService._process_file, args=(realtor_csv,),
+                                     rounds=3, iterations=1)
+    assert destination.parent == CSVService.PROCESSED_DIR
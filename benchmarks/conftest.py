@@ -0,0 +1,54 @@
+"""
+Shared fixtures for the benchmark suite.
+
+Benchmarks run against the database configured through the usual
+POSTGRES_* environment variables. Every benchmark runs inside an outer
+transaction that is rolled back afterwards, so write scenarios do not
+change the dataset between runs.
+"""
+import os
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture(scope="session")
+def app():
+    from app import create_app
+    from app.services import CSVService
+
+    # The api role does not start the scheduler, whose periodic import job
+    # would compete with the benchmarks for the DB; the CSV benchmarks only
+    # need CSVService configured.
+    app = create_app(role="api")
+    CSVService.init_app(app)
+    return app
+
+
+@pytest.fixture
+def db(app):
+    from app import database
+
+    connection = database.get_engine().connect()
+    outer = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    with app.app_context():
+        yield session
+    session.close()
+    outer.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def building_ids(app) -> list[int]:
+    """A fixed sample of existing building ids."""
+    from app import database
+    from app.models import Building
+
+    limit = int(os.getenv("BENCH_ID_SAMPLE", 1000))
+    with Session(database.get_engine()) as session:
+        ids = session.scalars(select(Building.id).order_by(Building.id).limit(limit)).all()
+    if not ids:
+        pytest.skip("No buildings in the database; seed it with benchmarks.datagen first.")
+    return ids
@@ -0,0 +1,228 @@
+"""
+Synthetic data generator for the benchmark suite.
+
+Scales the `db-init` dataset up to an arbitrary number of buildings by
+resampling existing rows: scalar columns are jittered copies of real
+buildings, and every building gets the same amenity/heating fan-out
+distribution as the seed data. Rows are streamed to PostgreSQL with COPY.
+
+Usage:
+    python -m benchmarks.datagen buildings --count 1000000
+    python -m benchmarks.datagen csv --rows 500000 --out data/bench.csv
+"""
+import argparse
+import csv
+import io
+import random
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from sqlalchemy import create_engine, text
+
+COPY_BATCH_ROWS = 50_000
+
+FLOOR_LEVELS = ["PR", "VPR", "1", "2", "3", "4", "5", "6", "7", "8", "PK"]
+REALTOR_COLUMNS = [
+    "brokered_by", "status", "price", "bed", "bath", "acre_lot",
+    "street", "city", "state", "zip_code", "house_size", "prev_sold_date",
+]
+REALTOR_STATUSES = ["for_sale"] * 8 + ["sold", "ready_to_build"]
+
+
+# Ids stay unique across the hot and archive tables (search with
+# include_archived and the change feed mix both).
+_ALL_BUILDING_IDS = "SELECT id FROM building UNION ALL SELECT id FROM building_archive"
+
+
+def _database_uri() -> str:
+    from app.config import Config
+    from app.database import database_uri
+    return database_uri(vars(Config))
+
+
+def _fanout_histogram(conn, table: str, column: str) -> tuple[list[int], list[int]]:
+    """Distribution of association rows per building, including zero."""
+    rows = conn.execute(text(
+        f"SELECT n, count(*) FROM ("
+        f"  SELECT b.id, count(t.{column}) AS n FROM building b"
+        f"  LEFT JOIN {table} t ON t.building_id = b.id GROUP BY b.id"
+        f") s GROUP BY n"
+    )).all()
+    return [n for n, _ in rows], [weight for _, weight in rows]
+
+
+def _copy(cursor, table: str, columns: list[str], rows: Iterable[tuple]) -> None:
+    """Stream `rows` into `table` using COPY, in batches."""
+    buffer = io.StringIO()
+    pending = 0
+
+    def flush():
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+        buffer.seek(0)
+        buffer.truncate()
+
+    for row in rows:
+        buffer.write("\t".join(r"\N" if v is None else str(v) for v in row))
+        buffer.write("\n")
+        pending += 1
+        if pending >= COPY_BATCH_ROWS:
+            flush()
+            pending = 0
+    if pending:
+        flush()
+
+
+def _jitter(value, rng: random.Random, spread: float = 0.15):
+    if value is None:
+        return None
+    jittered = value * rng.uniform(1 - spread, 1 + spread)
+    return type(value)(round(jittered, 2) if isinstance(value, float) else round(jittered))
+
+
+def generate_buildings(count: int, seed: int = 42, database_uri: str | None = None) -> None:
+    """
+    Insert `count` synthetic buildings (plus floors, amenities and heatings).
+
+    Args:
+        count (int): Number of buildings to generate.
+        seed (int): Random seed, so runs are reproducible.
+        database_uri (str | None): Target database, defaults to `Config`.
+    """
+    rng = random.Random(seed)
+    engine = create_engine(database_uri or _database_uri())
+
+    with engine.connect() as conn:
+        templates = conn.execute(text(
+            "SELECT square_footage, construction_year, land_area, registration, rooms,"
+            " bathrooms, parking, price, estate_type_id, offer_id, city_part_id"
+            " FROM building ORDER BY random() LIMIT 50000"
+        )).all()
+        if not templates:
+            raise RuntimeError("Seed the database from db-init before generating data.")
+        amenity_ids = conn.scalars(text("SELECT id FROM amenity")).all()
+        heating_ids = conn.scalars(text("SELECT id FROM heating")).all()
+        amenity_counts, amenity_weights = _fanout_histogram(conn, "building_amenity", "amenity_id")
+        heating_counts, heating_weights = _fanout_histogram(conn, "building_heating", "heating_id")
+        first_id = conn.scalar(text(f"SELECT coalesce(max(id), 0) + 1 FROM ({_ALL_BUILDING_IDS}) ids"))
+
+    ids = range(first_id, first_id + count)
+
+    def buildings() -> Iterator[tuple]:
+        for building_id in ids:
+            t = rng.choice(templates)
+            yield (building_id, _jitter(t.square_footage, rng), t.construction_year,
+                   _jitter(t.land_area, rng), t.registration, t.rooms, t.bathrooms,
+                   t.parking, _jitter(t.price, rng), t.estate_type_id, t.offer_id,
+                   t.city_part_id)
+
+    def floors() -> Iterator[tuple]:
+        for building_id in ids:
+            total = rng.randint(1, 20)
+            yield building_id, rng.choice(FLOOR_LEVELS), total
+
+    def links(choices: list[int], counts: list[int], weights: list[int]) -> Iterator[tuple]:
+        for building_id in ids:
+            n = min(rng.choices(counts, weights)[0], len(choices))
+            for linked_id in rng.sample(choices, n):
+                yield building_id, linked_id
+
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        _copy(cursor, "building",
+              ["id", "square_footage", "construction_year", "land_area", "registration",
+               "rooms", "bathrooms", "parking", "price", "estate_type_id", "offer_id",
+               "city_part_id"],
+              buildings())
+        _copy(cursor, "building_floor", ["building_id", "floor_level", "floor_total"], floors())
+        _copy(cursor, "building_amenity", ["building_id", "amenity_id"],
+              links(amenity_ids, amenity_counts, amenity_weights))
+        _copy(cursor, "building_heating", ["building_id", "heating_id"],
+              links(heating_ids, heating_counts, heating_weights))
+        cursor.execute(f"SELECT setval('public.buildings_id_seq', (SELECT max(id) FROM ({_ALL_BUILDING_IDS}) ids))")
+        # COPY bypasses StatsService, so recompute the rollup once at the end.
+        from app.services.stats_service import StatsService
+        cursor.execute(StatsService.REBUILD_SQL)
+        cursor.execute("ANALYZE building, building_floor, building_amenity, building_heating")
+        raw.commit()
+    finally:
+        raw.close()
+
+
+def write_realtor_csv(path: Path, rows: int, seed: int = 42) -> Path:
+    """
+    Write a CSV in the realtor layout consumed by `CSVService`.
+
+    Args:
+        path (Path): Destination file.
+        rows (int): Number of data rows.
+        seed (int): Random seed, so files are reproducible.
+
+    Returns:
+        Path: The written file.
+    """
+    rng = random.Random(seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(REALTOR_COLUMNS)
+        for i in range(rows):
+            writer.writerow([
+                rng.randint(1, 100_000),
+                rng.choice(REALTOR_STATUSES),
+                rng.randint(50_000, 2_000_000),
+                rng.choice(["", 1, 2, 3, 4, 5]),
+                rng.choice(["", 1, 2, 3]),
+                round(rng.uniform(0.05, 5), 2),
+                rng.randint(1, 2_000_000),
+                f"City {rng.randint(1, 500)}",
+                f"State {rng.randint(1, 50)}",
+                f"{rng.randint(0, 99_999):05d}",
+                rng.choice(["", rng.randint(400, 6000)]),
+                "",
+            ])
+    return path
+
+
+def fanout_summary(database_uri: str | None = None) -> dict:
+    """Average association rows per building, for sanity-checking generated data."""
+    engine = create_engine(database_uri or _database_uri())
+    with engine.connect() as conn:
+        counts = Counter({
+            table: conn.scalar(text(f"SELECT count(*) FROM {table}"))
+            for table in ("building", "building_amenity", "building_heating")
+        })
+    buildings = counts["building"] or 1
+    return {
+        "buildings": counts["building"],
+        "amenities_per_building": counts["building_amenity"] / buildings,
+        "heatings_per_building": counts["building_heating"] / buildings,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    buildings = sub.add_parser("buildings", help="Insert synthetic buildings into the database")
+    buildings.add_argument("--count", type=int, default=1_000_000)
+    buildings.add_argument("--seed", type=int, default=42)
+
+    realtor = sub.add_parser("csv", help="Write a realtor-layout CSV for the importer")
+    realtor.add_argument("--rows", type=int, default=500_000)
+    realtor.add_argument("--out", type=Path, required=True)
+    realtor.add_argument("--seed", type=int, default=42)
+
+    args = parser.parse_args()
+    if args.command == "buildings":
+        generate_buildings(args.count, seed=args.seed)
+        print(fanout_summary())
+    else:
+        print(write_realtor_csv(args.out, args.rows, seed=args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Cold-start benchmark: import cost and `create_app` time per app role.
+
+Each role is started in a fresh interpreter under `python -X importtime`,
+so nothing is cached between runs. The report lists the total import time,
+the slowest top-level packages (cumulative microseconds, as printed by
+`-X importtime`) and the wall time of `create_app` itself, and whether the
+importer-only dependencies (pandas, numpy, apscheduler) were loaded.
+
+The database is never contacted: the engine is created on first use.
+
+Usage:
+    python -m benchmarks.importtime --roles api importer all --repeat 5 \
+        --out benchmarks/results/importtime.json
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROLES = ("api", "importer", "all")
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "apscheduler")
+
+# Runs in the child interpreter; prints one JSON line on stdout.
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app(role={role!r})
+created = time.perf_counter()
+from app import scheduler
+if scheduler is not None:
+    scheduler.shutdown(wait=False)
+print(json.dumps({{
+    "import_s": imported - start,
+    "create_app_s": created - imported,
+    "loaded": [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$")
+
+# Dummy settings, so startup does not depend on a .env file; nothing connects.
+_ENV = {
+    "POSTGRES_USER": "bench",
+    "POSTGRES_PASSWORD": "bench",
+    "POSTGRES_DB": "bench",
+    "POSTGRES_HOST": "localhost",
+    "JWT_SECRET_KEY": "bench",
+}
+
+
+def parse_importtime(stderr: str) -> tuple[int, dict[str, int]]:
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        tuple: Total self time of all imports (us) and the cumulative time of
+            every top-level import (us), keyed by module name.
+    """
+    total = 0
+    top_level = {}
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        total += int(self_us)
+        if len(indent) == 1:
+            top_level[name] = top_level.get(name, 0) + int(cumulative_us)
+    return total, top_level
+
+
+def run_role(role: str) -> dict:
+    """Start the app in `role` in a fresh interpreter and measure it."""
+    env = {**os.environ, **{key: os.environ.get(key) or value for key, value in _ENV.items()}}
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD.format(role=role, heavy=HEAVY_MODULES)],
+        capture_output=True, text=True, env=env, cwd=Path(__file__).resolve().parent.parent,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"create_app(role={role!r}) failed:\n{proc.stderr[-2000:]}")
+
+    total_us, top_level = parse_importtime(proc.stderr)
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["import_total_us"] = total_us
+    result["top_level_us"] = top_level
+    return result
+
+
+def summarize(role: str, runs: list[dict], top: int) -> dict:
+    """Median of every measurement over `runs`."""
+    modules = defaultdict(list)
+    for run in runs:
+        for name, us in run["top_level_us"].items():
+            modules[name].append(us)
+    slowest = sorted(((name, statistics.median(values)) for name, values in modules.items()),
+                     key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "role": role,
+        "runs": len(runs),
+        "import_total_ms": round(statistics.median(r["import_total_us"] for r in runs) / 1000, 1),
+        "import_app_ms": round(statistics.median(r["import_s"] for r in runs) * 1000, 1),
+        "create_app_ms": round(statistics.median(r["create_app_s"] for r in runs) * 1000, 1),
+        "loaded": runs[-1]["loaded"],
+        "slowest": [{"module": name, "cumulative_ms": round(us / 1000, 1)} for name, us in slowest],
+    }
+
+
+def print_report(results: list[dict]) -> None:
+    print(f"{'role':<10}{'imports ms':>12}{'import app ms':>15}{'create_app ms':>15}  heavy modules")
+    for r in results:
+        print(f"{r['role']:<10}{r['import_total_ms']:>12}{r['import_app_ms']:>15}{r['create_app_ms']:>15}"
+              f"  {', '.join(r['loaded']) or '-'}")
+    for r in results:
+        print(f"\nslowest top-level imports ({r['role']}):")
+        for entry in r["slowest"]:
+            print(f"  {entry['cumulative_ms']:>8} ms  {entry['module']}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--roles", nargs="+", choices=ROLES, default=list(ROLES))
+    parser.add_argument("--repeat", type=int, default=5, help="interpreters started per role")
+    parser.add_argument("--top", type=int, default=10, help="slowest top-level imports to report")
+    parser.add_argument("--out", type=Path, help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = [summarize(role, [run_role(role) for _ in range(args.repeat)], args.top) for role in args.roles]
+    print_report(results)
+
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"created_at": datetime.now(timezone.utc).isoformat(), "python": sys.version, "roles": results}
+        args.out.write_text(json.dumps(payload, indent=2))
+
+
+if __name__ == "__main__":
+    main()
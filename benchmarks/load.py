@@ -0,0 +1,169 @@
+"""
+HTTP load script that replays a request log against a running API.
+
+The log is one or more JSONL files with one request per line, either
+written by `CaptureService` (CAPTURE_ENABLED=true, one file per worker
+process) or by hand:
+
+    {"method": "GET", "path": "/api/v1/buildings/search", "query": {"state": ["Srbija"]}}
+    {"method": "POST", "path": "/api/v1/buildings", "body": {...}}
+
+Captured requests only carry a hash of their body, so writes without a
+`body` are skipped. Results (throughput, status codes and p50/p95/p99
+latency overall and per endpoint) are written as JSON so runs can be
+compared.
+
+Usage:
+    python -m benchmarks.load requests.*.jsonl* --base-url http://localhost:5000 \
+        --concurrency 16 --out benchmarks/results/load.json
+"""
+import argparse
+import json
+import math
+import statistics
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+def load_requests(*paths: Path) -> list[dict]:
+    """Read one or more JSONL request logs, skipping blank lines."""
+    entries = []
+    for path in paths:
+        with Path(path).open() as f:
+            entries.extend(json.loads(line) for line in f if line.strip())
+    return entries
+
+
+def is_replayable(entry: dict) -> bool:
+    """Reads are always replayable; writes only when the log carries their body."""
+    return entry.get("method", "GET") in ("GET", "HEAD") or entry.get("body") is not None
+
+
+def endpoint_key(entry: dict) -> str:
+    """Group requests by Flask endpoint when captured, by method and path otherwise."""
+    return f"{entry.get('method', 'GET')} {entry.get('endpoint') or entry['path']}"
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of `values` (0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def send(base_url: str, entry: dict, token: str | None = None, timeout: float = 30) -> tuple[int, float]:
+    """
+    Send a single logged request.
+
+    Returns:
+        tuple[int, float]: HTTP status (0 on connection errors) and latency in seconds.
+    """
+    url = base_url.rstrip("/") + entry["path"]
+    if entry.get("query"):
+        url += "?" + urllib.parse.urlencode(entry["query"], doseq=True)
+
+    data = None
+    headers = {}
+    if entry.get("body") is not None:
+        data = json.dumps(entry["body"]).encode()
+        headers["Content-Type"] = "application/json"
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    request = urllib.request.Request(url, data=data, headers=headers, method=entry.get("method", "GET"))
+    started_at = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except (urllib.error.URLError, TimeoutError):
+        status = 0
+    return status, time.perf_counter() - started_at
+
+
+def latency_summary(latencies: list[float]) -> dict:
+    return {
+        "mean": statistics.fmean(latencies) if latencies else 0.0,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "max": max(latencies, default=0.0),
+    }
+
+
+def run(entries: list[dict], base_url: str, concurrency: int, token: str | None = None) -> dict:
+    """
+    Replay `entries` with `concurrency` worker threads and summarize the run.
+    """
+    replayable = [entry for entry in entries if is_replayable(entry)]
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda entry: send(base_url, entry, token), replayable))
+    elapsed = time.perf_counter() - started_at
+
+    latencies = [latency for _, latency in results]
+    statuses = Counter(str(status) for status, _ in results)
+
+    by_endpoint: dict[str, list[float]] = {}
+    captured_by_endpoint: dict[str, list[float]] = {}
+    for entry, (_, latency) in zip(replayable, results):
+        key = endpoint_key(entry)
+        by_endpoint.setdefault(key, []).append(latency)
+        if entry.get("latency_ms") is not None:
+            captured_by_endpoint.setdefault(key, []).append(entry["latency_ms"] / 1000)
+
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "base_url": base_url,
+        "concurrency": concurrency,
+        "requests": len(results),
+        "skipped": len(entries) - len(replayable),
+        "errors": sum(1 for status, _ in results if status == 0 or status >= 500),
+        "elapsed_seconds": elapsed,
+        "requests_per_second": len(results) / elapsed if elapsed else 0.0,
+        "latency_seconds": latency_summary(latencies),
+        "statuses": dict(statuses),
+        "endpoints": {
+            key: {
+                "requests": len(values),
+                "latency_seconds": latency_summary(values),
+                "captured_latency_seconds": latency_summary(captured_by_endpoint.get(key, [])),
+            }
+            for key, values in sorted(by_endpoint.items())
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("logs", type=Path, nargs="+", help="JSONL request log(s) to replay")
+    parser.add_argument("--base-url", default="http://localhost:5000")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=1, help="Replay the log this many times")
+    parser.add_argument("--token", help="Bearer token for authenticated endpoints")
+    parser.add_argument("--out", type=Path, help="Write the JSON summary to this file")
+    args = parser.parse_args()
+
+    entries = load_requests(*args.logs) * args.repeat
+    summary = run(entries, args.base_url, args.concurrency, token=args.token)
+
+    output = json.dumps(summary, indent=2)
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -109601,6 +109601,317 @@ ALTER TABLE ONLY public.building
     ADD CONSTRAINT fk_buildings_offer FOREIGN KEY (offer_id) REFERENCES public.offer(id) ON DELETE RESTRICT;
 
 
+--
+-- Name: app_user; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.app_user (
+    id integer NOT NULL,
+    username character varying NOT NULL,
+    password_hash character varying NOT NULL,
+    is_service boolean DEFAULT false NOT NULL,
+    is_active boolean DEFAULT true NOT NULL
+);
+
+
+--
+-- Name: app_user_id_seq; Type: SEQUENCE; Schema: public; Owner: -
+--
+
+CREATE SEQUENCE public.app_user_id_seq
+    AS integer
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1;
+
+
+--
+-- Name: app_user_id_seq; Type: SEQUENCE OWNED BY; Schema: public; Owner: -
+--
+
+ALTER SEQUENCE public.app_user_id_seq OWNED BY public.app_user.id;
+
+
+--
+-- Name: app_user id; Type: DEFAULT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.app_user ALTER COLUMN id SET DEFAULT nextval('public.app_user_id_seq'::regclass);
+
+
+--
+-- Data for Name: app_user; Type: TABLE DATA; Schema: public; Owner: -
+--
+
+COPY public.app_user (id, username, password_hash, is_service, is_active) FROM stdin;
+1	rbt	scrypt:32768:8:1$a8tTNsxFGLdDP14w$b04a9683915eae06a7ece64a3ac26fd9e63d77e4fb010b7953a3a13bbe2cefd5b551a5f20d202c51ef398db54de577f056d56d15b75c06ebae81a608038f6847	f	t
+\.
+
+
+--
+-- Name: app_user_id_seq; Type: SEQUENCE SET; Schema: public; Owner: -
+--
+
+SELECT pg_catalog.setval('public.app_user_id_seq', 1, true);
+
+
+--
+-- Name: app_user app_user_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.app_user
+    ADD CONSTRAINT app_user_pkey PRIMARY KEY (id);
+
+
+--
+-- Name: app_user app_user_username_key; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.app_user
+    ADD CONSTRAINT app_user_username_key UNIQUE (username);
+
+
+--
+-- Name: building_change_seq; Type: SEQUENCE; Schema: public; Owner: -
+--
+
+CREATE SEQUENCE public.building_change_seq
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1;
+
+
+--
+-- Name: building change_seq; Type: COLUMN; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.building
+    ADD COLUMN change_seq bigint DEFAULT nextval('public.building_change_seq'::regclass) NOT NULL,
+    ADD COLUMN change_xid bigint DEFAULT (pg_current_xact_id())::text::bigint NOT NULL,
+    ADD COLUMN updated_at timestamp with time zone DEFAULT now() NOT NULL;
+
+
+--
+-- Name: building_change_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE UNIQUE INDEX building_change_idx ON public.building USING btree (change_xid, change_seq);
+
+
+--
+-- Name: building import_batch; Type: COLUMN; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.building
+    ADD COLUMN import_batch character varying;
+
+
+--
+-- Name: ix_building_import_batch; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_building_import_batch ON public.building USING btree (import_batch);
+
+
+--
+-- Name: building_archive; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.building_archive (
+    id integer NOT NULL,
+    square_footage double precision,
+    construction_year integer,
+    land_area double precision,
+    registration boolean,
+    rooms double precision,
+    bathrooms integer,
+    parking boolean,
+    price integer,
+    estate_type_id integer,
+    offer_id integer,
+    city_part_id integer,
+    import_batch character varying,
+    change_seq bigint NOT NULL,
+    change_xid bigint NOT NULL,
+    updated_at timestamp with time zone NOT NULL,
+    archived_at timestamp with time zone DEFAULT now() NOT NULL,
+    floor_level character varying,
+    floor_total integer,
+    amenity_ids integer[] DEFAULT '{}'::integer[] NOT NULL,
+    heating_ids integer[] DEFAULT '{}'::integer[] NOT NULL
+);
+
+
+--
+-- Name: building_archive building_archive_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.building_archive
+    ADD CONSTRAINT building_archive_pkey PRIMARY KEY (id);
+
+
+--
+-- Name: building_archive_change_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE UNIQUE INDEX building_archive_change_idx ON public.building_archive USING btree (change_xid, change_seq);
+
+
+--
+-- Name: building_archive fk_building_archive_city_part; Type: FK CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.building_archive
+    ADD CONSTRAINT fk_building_archive_city_part FOREIGN KEY (city_part_id) REFERENCES public.city_part(id) ON DELETE RESTRICT;
+
+
+--
+-- Name: building_archive fk_building_archive_estate_type; Type: FK CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.building_archive
+    ADD CONSTRAINT fk_building_archive_estate_type FOREIGN KEY (estate_type_id) REFERENCES public.estate_type(id) ON DELETE RESTRICT;
+
+
+--
+-- Name: building_archive fk_building_archive_offer; Type: FK CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.building_archive
+    ADD CONSTRAINT fk_building_archive_offer FOREIGN KEY (offer_id) REFERENCES public.offer(id) ON DELETE RESTRICT;
+
+
+--
+-- Name: ix_building_updated_at; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_building_updated_at ON public.building USING btree (updated_at);
+
+
+--
+-- Name: building_stats; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.building_stats (
+    id integer NOT NULL,
+    state_id integer,
+    city_id integer,
+    estate_type_id integer,
+    offer_id integer,
+    count bigint DEFAULT 0 NOT NULL,
+    price_n bigint DEFAULT 0 NOT NULL,
+    price_sum double precision DEFAULT 0 NOT NULL,
+    price_sumsq double precision DEFAULT 0 NOT NULL,
+    square_footage_n bigint DEFAULT 0 NOT NULL,
+    square_footage_sum double precision DEFAULT 0 NOT NULL,
+    square_footage_sumsq double precision DEFAULT 0 NOT NULL,
+    land_area_n bigint DEFAULT 0 NOT NULL,
+    land_area_sum double precision DEFAULT 0 NOT NULL,
+    land_area_sumsq double precision DEFAULT 0 NOT NULL,
+    price_per_sqm_n bigint DEFAULT 0 NOT NULL,
+    price_per_sqm_sum double precision DEFAULT 0 NOT NULL,
+    price_per_sqm_sumsq double precision DEFAULT 0 NOT NULL
+);
+
+
+--
+-- Name: building_stats_id_seq; Type: SEQUENCE; Schema: public; Owner: -
+--
+
+CREATE SEQUENCE public.building_stats_id_seq
+    AS integer
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1;
+
+
+--
+-- Name: building_stats_id_seq; Type: SEQUENCE OWNED BY; Schema: public; Owner: -
+--
+
+ALTER SEQUENCE public.building_stats_id_seq OWNED BY public.building_stats.id;
+
+
+--
+-- Name: building_stats id; Type: DEFAULT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.building_stats ALTER COLUMN id SET DEFAULT nextval('public.building_stats_id_seq'::regclass);
+
+
+--
+-- Name: building_stats building_stats_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.building_stats
+    ADD CONSTRAINT building_stats_pkey PRIMARY KEY (id);
+
+
+--
+-- Name: building_stats building_stats_group_key; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.building_stats
+    ADD CONSTRAINT building_stats_group_key UNIQUE NULLS NOT DISTINCT (state_id, city_id, estate_type_id, offer_id);
+
+
+--
+-- Data for Name: building_stats; Type: TABLE DATA; Schema: public; Owner: -
+-- Initial rollup of the buildings loaded above (same query as `flask stats rebuild`).
+--
+
+INSERT INTO public.building_stats (
+    state_id, city_id, estate_type_id, offer_id, count,
+    price_n, price_sum, price_sumsq,
+    square_footage_n, square_footage_sum, square_footage_sumsq,
+    land_area_n, land_area_sum, land_area_sumsq,
+    price_per_sqm_n, price_per_sqm_sum, price_per_sqm_sumsq
+)
+SELECT c.state_id, cp.city_id, s.estate_type_id, s.offer_id, count(*),
+       count(s.price), coalesce(sum(s.price), 0), coalesce(sum(s.price ^ 2), 0),
+       count(s.square_footage), coalesce(sum(s.square_footage), 0),
+       coalesce(sum(s.square_footage ^ 2), 0),
+       count(s.land_area), coalesce(sum(s.land_area), 0), coalesce(sum(s.land_area ^ 2), 0),
+       count(s.ppsqm), coalesce(sum(s.ppsqm), 0), coalesce(sum(s.ppsqm ^ 2), 0)
+FROM (
+    SELECT b.city_part_id, b.estate_type_id, b.offer_id,
+           b.price::double precision AS price, b.square_footage, b.land_area,
+           b.price / nullif(b.square_footage, 0) AS ppsqm
+    FROM public.building b
+) s
+LEFT JOIN public.city_part cp ON cp.id = s.city_part_id
+LEFT JOIN public.city c ON c.id = cp.city_id
+GROUP BY 1, 2, 3, 4;
+
+
+--
+-- Name: import_progress; Type: TABLE; Schema: public; Owner: -
+-- Rows of each imported CSV already committed, see CSVService._process_file.
+--
+
+CREATE TABLE public.import_progress (
+    source_sha256 character varying(64) NOT NULL,
+    label character varying NOT NULL,
+    import_batch character varying NOT NULL,
+    rows_done bigint DEFAULT 0 NOT NULL,
+    updated_at timestamp with time zone DEFAULT now() NOT NULL
+);
+
+
+--
+-- Name: import_progress import_progress_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.import_progress
+    ADD CONSTRAINT import_progress_pkey PRIMARY KEY (source_sha256, label);
+
+
 --
 -- PostgreSQL database dump complete
 --
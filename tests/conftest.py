@@ -0,0 +1,42 @@
+"""
+Shared fixtures for the test suite.
+
+Tests run the app against a throwaway SQLite file, so they need no
+PostgreSQL; anything that depends on PostgreSQL features is stubbed at the
+service boundary by the tests themselves.
+"""
+import pytest
+
+from app.config import Config
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    """Factory creating an app (api role by default); keyword arguments override Config."""
+    import app as app_package
+
+    def factory(role="api", **overrides):
+        settings = {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'test.db'}",
+            "DATA_DIR": tmp_path / "data",
+            "PROCESSED_DIR": tmp_path / "processed",
+            "ERRORED_DIR": tmp_path / "errored",
+            "RATELIMIT_ENABLED": False,
+            "CAPTURE_ENABLED": False,
+            "WRITE_QUEUE_PATH": tmp_path / "write_queue.sqlite3",
+            "EXPORT_DIR": tmp_path / "exports",
+            "TESTING": True,
+            **overrides,
+        }
+        return app_package.create_app(type("TestConfig", (Config,), settings), role=role)
+
+    yield factory
+
+    if app_package.scheduler is not None:
+        app_package.scheduler.shutdown(wait=False)
+        app_package.scheduler = None
+
+    from app import database
+    if database.engine is not None:
+        database.engine.dispose()
+        database.engine = None
@@ -0,0 +1,68 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.models import Building, Offer
+
+
+class FeedSession:
+    """
+    Stands in for the session used by BuildingService.changes_since, whose
+    queries rely on PostgreSQL snapshot functions.
+    """
+
+    def __init__(self, buildings, deletes=()):
+        self.buildings = buildings
+        self.deletes = deletes
+
+    def scalar(self, stmt):
+        return 2 ** 32   # watermark above every change
+
+    def scalars(self, stmt):
+        return iter(self.buildings)
+
+    def execute(self, stmt):
+        return SimpleNamespace(all=lambda: list(self.deletes))
+
+
+@pytest.fixture
+def client(make_app):
+    return make_app().test_client()
+
+
+def test_feed_streams_imported_building_without_estate_type(client, monkeypatch):
+    imported = Building(id=7, price=250_000, estate_type=None, offer=Offer(id=1, name="Prodaja"),
+                        city_part=None, change_xid=3, change_seq=5)
+    archived = SimpleNamespace(id=8, change_xid=4, change_seq=6)
+    monkeypatch.setattr("app.routes.v1.building.get_db", lambda: FeedSession([imported], [archived]))
+
+    response = client.get("/api/v1/buildings/changes")
+
+    assert response.status_code == 200
+    changes = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [(c["op"], c["id"], c["cursor"]) for c in changes] == [("upsert", 7, "3:5"), ("delete", 8, "4:6")]
+    assert changes[0]["building"]["estate_type"] is None
+    assert changes[0]["building"]["offer"] == {"id": 1, "name": "Prodaja"}
+
+
+@pytest.mark.parametrize("since", ["12", "12:", "a:1", "1:2:3"])
+def test_bad_cursor_is_a_json_400(client, since):
+    response = client.get("/api/v1/buildings/changes", query_string={"since": since})
+
+    assert response.status_code == 400
+    assert response.is_json
+    assert response.get_json()["validation_error"]["query_params"][0]["loc"] == ["since"]
+
+
+def test_cursor_is_parsed(client, monkeypatch):
+    seen = {}
+
+    def changes_since(db, since, limit):
+        seen["since"] = since
+        return iter(())
+
+    monkeypatch.setattr("app.routes.v1.building.BuildingService.changes_since", changes_since)
+
+    assert client.get("/api/v1/buildings/changes", query_string={"since": "12:34"}).status_code == 200
+    assert seen["since"] == (12, 34)
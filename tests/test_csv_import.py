@@ -0,0 +1,68 @@
+import shutil
+
+import pytest
+
+from app import database
+from app.models import Amenity, City, CityPart, EstateType, Heating, ImportProgress, Offer, State
+from app.services import BuildingService
+from benchmarks.datagen import write_realtor_csv
+
+
+class FlakyWriter:
+    """Records the buildings written per chunk; optionally fails one chunk."""
+
+    def __init__(self):
+        self.inserted = []
+        self.chunks = 0
+        self.fail_at = None
+
+    def bulk_create(self, db, buildings_orm):
+        self.chunks += 1
+        if self.chunks == self.fail_at:
+            raise RuntimeError("connection lost")
+        self.inserted.extend(b.import_batch for b in buildings_orm)
+
+
+@pytest.fixture
+def csv_service(make_app, tmp_path, monkeypatch):
+    from app.services import CSVService
+
+    app = make_app(IMPORT_CHUNK_ROWS=10)
+    CSVService.init_app(app)
+    tables = [model.__table__ for model in (State, City, CityPart, EstateType, Offer, Amenity, Heating,
+                                            ImportProgress)]
+    database.Base.metadata.create_all(database.get_engine(), tables=tables)
+
+    writer = FlakyWriter()
+    monkeypatch.setattr(BuildingService, "bulk_create", writer.bulk_create)
+    monkeypatch.setattr(BuildingService, "bulk_link", lambda db, column, pairs: None)
+    CSVService.writer = writer
+    return CSVService
+
+
+def test_failed_import_resumes_after_committed_chunks(csv_service, tmp_path):
+    writer = csv_service.writer
+    source = write_realtor_csv(tmp_path / "source.csv", rows=45)
+
+    # Reference: the same content imported in one go, under another name
+    reference = shutil.copy(source, csv_service.DATA_DIR / "reference.csv")
+    assert csv_service._process_file(reference).parent == csv_service.PROCESSED_DIR
+    expected = len(writer.inserted)
+    assert expected > 0
+
+    path = shutil.copy(source, csv_service.DATA_DIR / "listings.csv")
+    writer.inserted.clear()
+    writer.chunks, writer.fail_at = 0, 3
+    assert csv_service._process_file(path).parent == csv_service.ERRORED_DIR
+    committed = len(writer.inserted)
+    assert 0 < committed < expected
+
+    # Dropped again: only the chunks after the last committed one are written
+    writer.fail_at = None
+    assert csv_service._process_file(path).parent == csv_service.PROCESSED_DIR
+    assert len(writer.inserted) == expected
+    assert len(set(writer.inserted)) == 1   # one import_batch across both runs
+
+    # Dropped once more after success: nothing is written
+    assert csv_service._process_file(path).parent == csv_service.PROCESSED_DIR
+    assert len(writer.inserted) == expected
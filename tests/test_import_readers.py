@@ -0,0 +1,31 @@
+import zipfile
+
+import pytest
+
+from app.services.import_profiles import RealtorProfile
+from app.services.import_readers import csv_sources, matches_any
+
+
+@pytest.mark.parametrize("name", ["listings.csv", "LISTINGS.CSV", "Listings.Csv"])
+def test_profiles_match_names_in_any_case(name):
+    assert RealtorProfile(config={}).matches(name)
+
+
+def test_patterns_match_in_any_case():
+    assert matches_any("EXPORT.CSV.GZ", ["*.gz"])
+    assert matches_any("export.zst", ["*.ZST"])
+    assert not matches_any("notes.txt", ["*.csv", "*.gz"])
+
+
+def test_zip_members_are_selected_in_any_case(tmp_path):
+    path = tmp_path / "batch.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("a.csv", "price\n1\n")
+        archive.writestr("B.CSV", "price\n2\n")
+        archive.writestr("readme.txt", "not a csv")
+
+    sources = [(label, name, sum(len(chunk) for chunk in chunks))
+               for label, name, chunks in csv_sources(path, chunk_rows=10, mmap_min_bytes=1 << 30)]
+
+    assert sources == [("batch.zip/a.csv", "a.csv", 1), ("batch.zip/B.CSV", "B.CSV", 1)]
+    assert all(RealtorProfile(config={}).matches(name) for _, name, _ in sources)
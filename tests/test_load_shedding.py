@@ -0,0 +1,77 @@
+import threading
+import time
+
+from sqlalchemy import text
+
+from app import database
+from app.database import get_db
+from app.services import LoadSheddingService
+
+READERS = 8
+
+
+def _pool_app(make_app):
+    # 3 connections, one of them reserved for writes
+    return make_app(DB_POOL_SIZE=3, DB_MAX_OVERFLOW=0, DB_POOL_TIMEOUT=1,
+                    LOAD_SHED_WRITE_RESERVE=1, LOAD_SHED_MAX_POOL_WAIT=0.2)
+
+
+def test_writes_get_a_connection_while_reads_flood(make_app):
+    app = _pool_app(make_app)
+    release = threading.Event()
+
+    @app.get("/slow-read")
+    @LoadSheddingService.shed
+    def slow_read():
+        time.sleep(0.05)   # validation etc. between admission and the first query
+        get_db().execute(text("SELECT 1"))
+        release.wait(5)
+        return {"ok": True}
+
+    @app.post("/write")
+    def write():
+        get_db().execute(text("SELECT 1"))
+        return {"ok": True}
+
+    statuses = []
+    burst = threading.Barrier(READERS)
+
+    def read():
+        client = app.test_client()
+        burst.wait()
+        statuses.append(client.get("/slow-read").status_code)
+
+    readers = [threading.Thread(target=read) for _ in range(READERS)]
+    for thread in readers:
+        thread.start()
+    try:
+        pool = database.get_engine().pool
+        deadline = time.monotonic() + 2
+        while pool.checkedout() < LoadSheddingService.READ_CAPACITY and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.3)   # every read not admitted has been shed by now
+
+        assert pool.checkedout() == LoadSheddingService.READ_CAPACITY
+        assert app.test_client().post("/write").status_code == 200
+    finally:
+        release.set()
+        for thread in readers:
+            thread.join()
+
+    assert sorted(statuses) == [200] * LoadSheddingService.READ_CAPACITY + \
+        [503] * (READERS - LoadSheddingService.READ_CAPACITY)
+
+
+def test_read_slots_are_released_after_the_request(make_app):
+    app = _pool_app(make_app)
+
+    @app.get("/read")
+    @LoadSheddingService.shed
+    def read():
+        get_db().execute(text("SELECT 1"))
+        return {"ok": True}
+
+    client = app.test_client()
+    for _ in range(LoadSheddingService.READ_CAPACITY * 3):
+        assert client.get("/read").status_code == 200
+    assert database.get_engine().pool.checkedout() == 0
@@ -0,0 +1,30 @@
+import pytest
+
+
+def _rules(app) -> set[str]:
+    return {rule.rule for rule in app.url_map.iter_rules()}
+
+
+def test_api_role_does_not_serve_import_status(make_app):
+    app = make_app(role="api")
+
+    assert "/api/v1/imports" not in _rules(app)
+    assert app.test_client().get("/api/v1/imports").status_code == 404
+
+
+def test_importer_role_serves_only_import_status_and_metrics(make_app):
+    app = make_app(role="importer")
+
+    assert {rule for rule in _rules(app) if rule.startswith("/api/v1/")} == {"/api/v1/imports", "/api/v1/metrics"}
+    assert app.test_client().get("/api/v1/imports").status_code == 200
+
+
+def test_all_role_serves_both(make_app):
+    rules = _rules(make_app(role="all"))
+
+    assert {"/api/v1/imports", "/api/v1/metrics", "/api/v1/buildings/search"} <= rules
+
+
+def test_unknown_role_is_rejected(make_app):
+    with pytest.raises(ValueError):
+        make_app(role="worker")